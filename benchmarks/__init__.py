@@ -0,0 +1,16 @@
+"""
+Benchmarks for the pylyngdorf library.
+
+Run a benchmark module from the repository root, e.g.
+``python -m benchmarks.bench_framer``.
+"""
+
+import sys
+from pathlib import Path
+
+# pylyngdorf is imported as a top level package, as in scripts/develop. The
+# directory is appended so its platform modules (select.py) cannot shadow the
+# standard library.
+sys.path.append(
+    str(Path(__file__).resolve().parent.parent / "custom_components" / "lyngdorf")
+)
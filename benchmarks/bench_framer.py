@@ -0,0 +1,64 @@
+"""Replay a 100k-line capture through the protocol line framer."""
+
+import contextlib
+import re
+import time
+
+from pylyngdorf.framer import LineFramer
+
+from .data import capture_lines
+
+_CAPTURE_LINES = 100_000
+_SEGMENT_SIZE = 1460  # One TCP segment on ethernet
+
+
+def build_capture() -> list[bytes]:
+    """Build a capture of state dumps and knob spins, cut into segments."""
+    lines = capture_lines(_CAPTURE_LINES)
+    stream = "".join(f"{line}\r\n" for line in lines).encode()
+    return [stream[i : i + _SEGMENT_SIZE] for i in range(0, len(stream), _SEGMENT_SIZE)]
+
+
+class LegacyFramer:
+    """The bytes-concatenating framer this benchmark compares against."""
+
+    def __init__(self, on_line) -> None:
+        self._buffer = b""
+        self._on_line = on_line
+
+    def feed(self, data: bytes) -> None:
+        self._buffer += data
+        while any(sep in self._buffer for sep in (b"\r", b"\n")):
+            line, self._buffer = re.split(b"[\r\n]+", self._buffer, maxsplit=1)
+            with contextlib.suppress(UnicodeDecodeError):
+                self._on_line(line.decode("utf-8"))
+
+
+def replay(framer_cls, segments: list[bytes]) -> tuple[float, list[str]]:
+    """Feed all segments and return elapsed seconds and the emitted lines."""
+    lines: list[str] = []
+    framer = framer_cls(lines.append)
+    started = time.perf_counter()
+    for segment in segments:
+        framer.feed(segment)
+    return time.perf_counter() - started, lines
+
+
+def main() -> None:
+    segments = build_capture()
+    legacy_time, legacy_lines = replay(LegacyFramer, segments)
+    framer_time, framer_lines = replay(LineFramer, segments)
+    # The legacy framer also emits an empty line for a split b"\r\n"
+    legacy_lines = [line for line in legacy_lines if line]
+    assert framer_lines == legacy_lines, "framers disagree on the line stream"
+
+    print(f"segments: {len(segments)}, lines: {len(framer_lines)}")
+    for name, elapsed in (("legacy", legacy_time), ("LineFramer", framer_time)):
+        print(
+            f"{name:>10}: {elapsed * 1000:8.1f} ms "
+            f"{len(framer_lines) / elapsed:12,.0f} lines/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
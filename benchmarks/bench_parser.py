@@ -0,0 +1,74 @@
+"""Parse a 100k-line capture with the regex parser and the tokenizer."""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from pylyngdorf.device import _EVENT_DECODERS
+from pylyngdorf.parser import (
+    decode_bool,
+    decode_indexed,
+    decode_int,
+    decode_tenths,
+    parse_message,
+    tokenize_message,
+)
+from pylyngdorf.utils import convert_on_off_bool, convert_volume
+
+from .data import capture_lines
+
+_CAPTURE_LINES = 100_000
+
+# The string conversions the callbacks did after the regex parser
+_LEGACY_CONVERSIONS: dict[Callable[..., Any], Callable[[list[str]], list[Any]]] = {
+    decode_bool: lambda params: [convert_on_off_bool(params[0])],
+    decode_int: lambda params: [int(param) for param in params],
+    decode_tenths: lambda params: [convert_volume(params[0])],
+    decode_indexed: lambda params: [int(params[0]), *params[1:]],
+}
+
+
+def legacy_parse(message: str) -> tuple[str, list[Any]] | None:
+    """Parse with the regex and convert the parameters as strings."""
+    parsed = parse_message(message)
+    if parsed is None:
+        return None
+    decoder = _EVENT_DECODERS.get(parsed.event)
+    if decoder is None or message[0] != "!" or not parsed.params:
+        return parsed.event, parsed.params
+    return parsed.event, _LEGACY_CONVERSIONS[decoder](parsed.params)
+
+
+def tokenized_parse(message: str) -> tuple[str, list[Any]] | None:
+    """Parse with the tokenizer and the typed decoders."""
+    parsed = tokenize_message(message) or parse_message(message)
+    if parsed is None:
+        return None
+    decoder = _EVENT_DECODERS.get(parsed.event)
+    if decoder is None or message[0] != "!":
+        return parsed.event, parsed.params
+    return parsed.event, decoder(parsed.params)
+
+
+def run(parse: Callable[[str], Any], lines: list[str]) -> tuple[float, list[Any]]:
+    """Parse all lines and return elapsed seconds and the results."""
+    started = time.perf_counter()
+    results = [parse(line) for line in lines]
+    return time.perf_counter() - started, results
+
+
+def main() -> None:
+    lines = capture_lines(_CAPTURE_LINES)
+    legacy_time, legacy_results = run(legacy_parse, lines)
+    tokenized_time, tokenized_results = run(tokenized_parse, lines)
+    assert tokenized_results == legacy_results, "parsers disagree on the capture"
+
+    print(f"lines: {len(lines)}")
+    for name, elapsed in (("regex", legacy_time), ("tokenizer", tokenized_time)):
+        print(
+            f"{name:>10}: {elapsed * 1000:8.1f} ms {len(lines) / elapsed:12,.0f} msg/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Compare the volume curve lookup tables with the reference functions."""
+
+import math
+import random
+import time
+from collections.abc import Callable
+
+from pylyngdorf.const import MIN_VOLUME_DB
+from pylyngdorf.utils import (
+    VolumeCurve,
+    db_to_linear_flattened,
+    linear_to_db_flattened,
+)
+
+_MAX_VOLUMES = (12.0, 0.0, -20.0, 5.5, 3.7, 24.0)
+_CALLS = 200_000
+_SWEEP = 200_000
+
+
+def check_exact(curve: VolumeCurve) -> int:
+    """Compare the curve with the reference functions and return the checks."""
+    max_volume, alpha = curve.max_volume, curve.alpha
+    checks = 0
+
+    # Every 0.1 dB step, plus values outside the range that get clamped
+    for step in range(-20, round((max_volume - MIN_VOLUME_DB) * 10) + 20):
+        db = round(MIN_VOLUME_DB + step / 10, 1)
+        expected = db_to_linear_flattened(db, max_volume, alpha)
+        assert curve.db_to_linear(db) == expected, (max_volume, db)
+        checks += 1
+
+    # A sweep of linear values, and the floats on both sides of each step
+    values = [i * 1.05 / _SWEEP for i in range(_SWEEP + 1)]
+    for threshold in curve._thresholds:
+        values += [math.nextafter(threshold, 0.0), threshold]
+    for value in values:
+        expected = linear_to_db_flattened(value, max_volume, alpha)
+        assert curve.linear_to_db(value) == expected, (max_volume, value)
+        checks += 1
+    return checks
+
+
+def run(convert: Callable[[float], float], values: list[float]) -> float:
+    """Convert all values and return the elapsed seconds."""
+    started = time.perf_counter()
+    for value in values:
+        convert(value)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    for max_volume in _MAX_VOLUMES:
+        started = time.perf_counter()
+        curve = VolumeCurve(max_volume)
+        curve.db_to_linear(max_volume)
+        curve.linear_to_db(1.0)
+        build = time.perf_counter() - started
+        checks = check_exact(curve)
+        print(
+            f"max {max_volume:5.1f} dB: built in {build * 1000:5.1f} ms, "
+            f"{checks:,} values identical"
+        )
+
+    curve = VolumeCurve(12.0)
+    rng = random.Random(0)
+    volume_events = [rng.randrange(-999, 120) / 10 for _ in range(_CALLS)]
+    slider_moves = [rng.random() for _ in range(_CALLS)]
+
+    results = (
+        (
+            "db_to_linear",
+            run(
+                lambda db: db_to_linear_flattened(db, 12.0, curve.alpha), volume_events
+            ),
+            run(curve.db_to_linear, volume_events),
+        ),
+        (
+            "linear_to_db",
+            run(lambda v: linear_to_db_flattened(v, 12.0, curve.alpha), slider_moves),
+            run(curve.linear_to_db, slider_moves),
+        ),
+    )
+    for name, reference, lookup in results:
+        print(
+            f"{name}: reference {_CALLS / reference:12,.0f}/s, "
+            f"lookup {_CALLS / lookup:12,.0f}/s ({reference / lookup:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
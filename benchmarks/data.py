@@ -0,0 +1,213 @@
+"""Recorded-style Lyngdorf traffic shared by the benchmarks."""
+
+from typing import Any
+
+MP60_STATE_DUMP = [
+    "#VERB(2)",
+    "#DEVICE?",
+    "!DEVICE(MP-60)",
+    "#POWER?",
+    "!POWER(1)",
+    "#MAXVOL?",
+    "!MAXVOL(120)",
+    "#VOL?",
+    "!VOL(-300)",
+    "#MUTE?",
+    "!MUTEOFF",
+    "#SRCS?",
+    "!SRCCOUNT(6)",
+    '!SRC(1,"HDMI 1")',
+    '!SRC(2,"TV")',
+    '!SRC(3,"Internal Player")',
+    '!SRC(4,"Roon")',
+    '!SRC(5,"Optical")',
+    '!SRC(6,"Analog XLR")',
+    "#SRC?",
+    '!SRC(2)"TV"',
+    "#STREAMTYPE?",
+    "!STREAMTYPE(0)",
+    "#RPVOIS?",
+    "!RPVOICOUNT(4)",
+    '!RPVOI(1,"Neutral")',
+    '!RPVOI(2,"Music")',
+    '!RPVOI(3,"Movie")',
+    '!RPVOI(4,"Night")',
+    "#RPVOI?",
+    '!RPVOI(1)"Neutral"',
+    "#RPFOCS?",
+    "!RPFOCCOUNT(3)",
+    '!RPFOC(0,"Global")',
+    '!RPFOC(1,"Sofa")',
+    '!RPFOC(2,"Desk")',
+    "#RPFOC?",
+    '!RPFOC(1)"Sofa"',
+    "#AUDMODEL?",
+    "!AUDMODECOUNT(4)",
+    '!AUDMODE(0,"None")',
+    '!AUDMODE(1,"Dolby Upmixer")',
+    '!AUDMODE(2,"DTS Neural:X")',
+    '!AUDMODE(3,"Auro-Matic")',
+    "#AUDMODE?",
+    '!AUDMODE(1)"Dolby Upmixer"',
+    "#AUDIN?",
+    "!AUDIN(1)",
+    "#AUDTYPE?",
+    '!AUDTYPE("Dolby Atmos","7.1.4")',
+    "#VIDIN?",
+    "!VIDIN(1)",
+    "#VIDTYPE?",
+    '!VIDTYPE("3840x2160p60 HDR10")',
+    "#HDMIMAINOUT?",
+    "!HDMIMAINOUT(1)",
+    "#LIPSYNCRANGE?",
+    "!LIPSYNCRANGE(0,500)",
+    "#LIPSYNC?",
+    "!LIPSYNC(20)",
+    "#DTSDIALOGAVAILABLE?",
+    "!DTSDIALOGAVAILABLE(0)",
+    "#DTSDIALOG?",
+    "!DTSDIALOG(0)",
+    "#LOUDNESS?",
+    "!LOUDNESS(1)",
+    "#TRIMBASS?",
+    "!TRIMBASS(-15)",
+    "#TRIMTREB?",
+    "!TRIMTREB(5)",
+    "#TRIMCENTER?",
+    "!TRIMCENTER(10)",
+    "#TRIMHEIGHT?",
+    "!TRIMHEIGHT(0)",
+    "#TRIMLFE?",
+    "!TRIMLFE(-20)",
+    "#TRIMSURRS?",
+    "!TRIMSURRS(0)",
+]
+
+TDAI3400_STATE_DUMP = [
+    "#VERB(2)",
+    "#DEVICE?",
+    "!DEVICE(TDAI-3400)",
+    "#PWR?",
+    "!PWR(1)",
+    "#VOL?",
+    "!VOL(-250)",
+    "#MUTE?",
+    "!MUTEOFF",
+    "#SRCLIST?",
+    "!SRCCOUNT(8)",
+    '!SRC(1,"Optical 1")',
+    '!SRC(2,"Optical 2")',
+    '!SRC(3,"Coax")',
+    '!SRC(4,"USB")',
+    '!SRC(5,"HDMI ARC")',
+    '!SRC(6,"Analog")',
+    '!SRC(7,"Streaming")',
+    '!SRC(8,"Bluetooth")',
+    "#SRCNAME?",
+    '!SRCNAME(7)"Streaming"',
+    "#STREAMTYPE?",
+    "!STREAMTYPE(2)",
+    "#AUDIOSTATUS?",
+    '!AUDIOSTATUS("PCM 44.1kHz")',
+    "#VOILIST?",
+    "!VOICOUNT(3)",
+    '!VOI(1,"Neutral")',
+    '!VOI(2,"Relaxed")',
+    '!VOI(3,"Sparkle")',
+    "#VOINAME?",
+    '!VOINAME(2)"Relaxed"',
+    "#RPLIST?",
+    "!RPCOUNT(2)",
+    '!RP(0,"Global")',
+    '!RP(1,"Listening")',
+    "#RPNAME?",
+    '!RPNAME(1)"Listening"',
+]
+
+
+def knob_spin(count: int, start: int = -300, stop: int = -100) -> list[str]:
+    """Return VOL events of a volume knob turned up and down in 0.5 dB steps."""
+    lines: list[str] = []
+    volume, step = start, 5
+    while len(lines) < count:
+        volume += step
+        if not start <= volume <= stop:
+            step = -step
+            volume += 2 * step
+        lines.append(f"!VOL({volume})")
+    return lines
+
+
+def capture_lines(count: int) -> list[str]:
+    """Return a capture of state dumps and knob spins."""
+    lines: list[str] = []
+    spin = knob_spin(40)
+    while len(lines) < count:
+        lines.extend(MP60_STATE_DUMP)
+        lines.extend(spin)
+        lines.extend(TDAI3400_STATE_DUMP)
+        lines.extend(spin)
+    return lines[:count]
+
+
+# One pollQueue response of the internal music player, during playback
+POLL_QUEUE_BATCH: list[dict[str, Any]] = [
+    {
+        "path": "player:player/data",
+        "itemType": "itemWithValue",
+        "itemValue": {
+            "state": "playing",
+            "status": {"duration": 251_000, "canSeek": True, "canPause": True},
+            "controls": {"previous": True, "next_": True, "pause": True},
+            "mediaRoles": {
+                "type": "container",
+                "title": "Favourites",
+                "icon": "http://192.168.1.20:8080/images/favourites.png",
+                "mediaData": {
+                    "metaData": {
+                        "serviceID": "qobuz",
+                        "artist": "Various Artists",
+                        "album": "Favourites",
+                    },
+                },
+            },
+            "trackRoles": {
+                "type": "audio",
+                "title": "Teardrop",
+                "icon": "https://static.qobuz.com/images/covers/0724384560/600.jpg",
+                "mediaData": {
+                    "metaData": {
+                        "serviceID": "qobuz",
+                        "artist": "Massive Attack",
+                        "album": "Mezzanine",
+                        "albumArtist": "Massive Attack",
+                        "playLogicPath": "qobuz:playlogic",
+                    },
+                    "resources": [
+                        {
+                            "mimeType": "audio/flac",
+                            "bitRate": 1411,
+                            "sampleFrequency": 44100,
+                            "nrAudioChannels": 2,
+                        }
+                    ],
+                },
+            },
+        },
+    },
+    {
+        "path": "player:player/data/playTime",
+        "itemType": "itemWithValue",
+        "itemValue": {"type": "i64_", "i64_": 73_500},
+    },
+    {
+        "path": "player:player/control",
+        "itemType": "itemWithValue",
+        "itemValue": {"type": "string_", "string_": "play"},
+    },
+    {
+        "path": "settings:/mediaPlayer/playMode",
+        "itemType": "itemWithValue",
+        "itemValue": {"type": "playerPlayMode", "playerPlayMode": "shuffle"},
+    },
+]
@@ -0,0 +1,358 @@
+"""
+Microbenchmarks of the pylyngdorf hot paths.
+
+Run ``python -m benchmarks.suite`` for a table, or add ``--json results.json``
+to also write the results for comparing runs. Captures recorded with
+pylyngdorf.capture are replayed as extra cases with ``--capture PATH``.
+Besides the throughput, every case reports the peak bytes traced by
+tracemalloc during one run, not the number of allocations.
+"""
+
+import argparse
+import asyncio
+import copy
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import attr
+from pylyngdorf.api import LyngdorfProtocol
+from pylyngdorf.capture import async_replay, read_capture
+from pylyngdorf.codec import ORJSON_CODEC, STDLIB_CODEC
+from pylyngdorf.const import TRAFFIC_RECEIVED, DeviceModel
+from pylyngdorf.lyngdorf import Lyngdorf
+from pylyngdorf.music_player import MediaData, MusicPlayer
+from pylyngdorf.utils import (
+    VolumeCurve,
+    db_to_linear_flattened,
+    linear_to_db_flattened,
+)
+
+from .data import (
+    MP60_STATE_DUMP,
+    POLL_QUEUE_BATCH,
+    TDAI3400_STATE_DUMP,
+    knob_spin,
+)
+
+_SEGMENT_SIZE = 1460
+_MIN_TIME = 0.2
+_MEMORY_ROUNDS = 20
+
+
+@attr.define
+class Case:
+    """A benchmarked operation working on a batch of items."""
+
+    name: str
+    run: Callable[[], Any]
+    items: int
+
+
+@attr.define
+class Result:
+    """Measurements of a case."""
+
+    name: str
+    items: int
+    ops_per_sec: float
+    items_per_sec: float
+    peak_bytes_per_op: float
+
+
+def _segments(lines: list[str]) -> list[bytes]:
+    """Encode lines as a stream cut into TCP segments."""
+    stream = "".join(f"{line}\r\n" for line in lines).encode()
+    return [stream[i : i + _SEGMENT_SIZE] for i in range(0, len(stream), _SEGMENT_SIZE)]
+
+
+def _device(model: DeviceModel | None) -> Lyngdorf:
+    """Return a device with registered callbacks and without a music player."""
+    device = Lyngdorf.create("127.0.0.1", device_model=model)
+    device._music_player = None
+    device._register_callbacks()
+    return device
+
+
+def _received_case(name: str, lines: list[str]) -> Case:
+    """Frame a stream through LyngdorfProtocol.data_received."""
+    protocol = LyngdorfProtocol(
+        on_message=lambda _: None, on_connection_lost=lambda: None
+    )
+    segments = _segments(lines)
+
+    def run() -> None:
+        for segment in segments:
+            protocol.data_received(segment)
+
+    return Case(name, run, len(lines))
+
+
+def _parse_case(name: str, model: DeviceModel, lines: list[str]) -> Case:
+    """Parse lines on the API of a device."""
+    parse = _device(model)._api._parse_message
+
+    def run() -> None:
+        for line in lines:
+            parse(line)
+
+    return Case(name, run, len(lines))
+
+
+def _callbacks_case(
+    name: str, model: DeviceModel, lines: list[str], loop: asyncio.AbstractEventLoop
+) -> Case:
+    """Decode parsed lines and run the device callbacks."""
+    api = _device(model)._api
+    parsed = [
+        (line, message)
+        for line in lines
+        if (message := api._parse_message(line)) is not None
+    ]
+
+    async def dispatch() -> None:
+        for line, message in parsed:
+            await api._async_run_callbacks(line, message)
+
+    return Case(name, lambda: loop.run_until_complete(dispatch()), len(parsed))
+
+
+def _replay_case(path: str, loop: asyncio.AbstractEventLoop) -> Case:
+    """Replay a capture into a device as fast as possible."""
+    device = _device(None)
+    lines = sum(
+        captured.direction == TRAFFIC_RECEIVED for captured in read_capture(path)
+    )
+    name = f"replay.{os.path.splitext(os.path.basename(path))[0]}"
+    return Case(
+        name,
+        lambda: loop.run_until_complete(async_replay(path, device, speed=None)),
+        lines,
+    )
+
+
+def _media_data_case() -> Case:
+    """Build MediaData from a pollQueue batch."""
+    events = {
+        item["path"]: item.get("itemValue")
+        for item in POLL_QUEUE_BATCH
+        if "path" in item
+    }
+    assert all(path in events for path in MusicPlayer.PATHS)
+    return Case("media_data.from_events", lambda: MediaData.from_events(events), 1)
+
+
+def _media_update_case(loop: asyncio.AbstractEventLoop) -> Case:
+    """Update MediaData from pollQueue batches that only move playTime a little."""
+    player = MusicPlayer("127.0.0.1")
+    loop.run_until_complete(player._update_events(None, POLL_QUEUE_BATCH))
+    loop.run_until_complete(player._dispatch_media_data())
+    batches = [
+        [
+            {
+                "path": MusicPlayer.PATH_PLAYTIME_DATA,
+                "itemType": "itemWithValue",
+                "itemValue": {"type": "i64_", "i64_": 73_500 + position % 2 * 1000},
+            }
+        ]
+        for position in range(100)
+    ]
+
+    async def update() -> None:
+        for batch in batches:
+            changed = await player._update_events(None, batch)
+            if changed:
+                await player._dispatch_media_data(changed)
+
+    return Case(
+        "media_data.playtime_batches",
+        lambda: loop.run_until_complete(update()),
+        len(batches),
+    )
+
+
+def _poll_payloads(count: int) -> list[bytes]:
+    """Encode pollQueue responses alternating between playing and paused."""
+    payloads = []
+    for index in range(count):
+        batch = copy.deepcopy(POLL_QUEUE_BATCH)
+        batch[0]["itemValue"]["state"] = "paused" if index % 2 else "playing"
+        batch[1]["itemValue"]["i64_"] += index * 1000
+        payloads.append(json.dumps(batch).encode())
+    return payloads
+
+
+def _poll_batch_cases(loop: asyncio.AbstractEventLoop) -> list[Case]:
+    """Decode pollQueue responses and update MediaData, per JSON codec."""
+    payloads = _poll_payloads(100)
+    cases = []
+    for codec in (STDLIB_CODEC, ORJSON_CODEC):
+        if codec is None:
+            continue
+        player = MusicPlayer("127.0.0.1", codec=codec)
+
+        async def update(player: MusicPlayer = player) -> None:
+            for payload in payloads:
+                changed = await player._update_events(None, player.codec.loads(payload))
+                if changed:
+                    await player._dispatch_media_data(changed)
+
+        cases.append(
+            Case(
+                f"poll_batch.{codec.name}",
+                lambda update=update: loop.run_until_complete(update()),
+                len(payloads),
+            )
+        )
+    return cases
+
+
+def _volume_cases(lines: list[str]) -> list[Case]:
+    """Convert knob spin volumes in both directions."""
+    curve = VolumeCurve(12.0)
+    max_volume, alpha = curve.max_volume, curve.alpha
+    volumes = [int(line[5:-1]) / 10 for line in lines]
+    levels = [curve.db_to_linear(volume) for volume in volumes]
+
+    def reference_to_linear() -> None:
+        for volume in volumes:
+            db_to_linear_flattened(volume, max_volume, alpha)
+
+    def reference_to_db() -> None:
+        for level in levels:
+            linear_to_db_flattened(level, max_volume, alpha)
+
+    def curve_to_linear() -> None:
+        for volume in volumes:
+            curve.db_to_linear(volume)
+
+    def curve_to_db() -> None:
+        for level in levels:
+            curve.linear_to_db(level)
+
+    return [
+        Case("volume.db_to_linear_flattened", reference_to_linear, len(volumes)),
+        Case("volume.linear_to_db_flattened", reference_to_db, len(levels)),
+        Case("volume.curve.db_to_linear", curve_to_linear, len(volumes)),
+        Case("volume.curve.linear_to_db", curve_to_db, len(levels)),
+    ]
+
+
+def build_cases(
+    loop: asyncio.AbstractEventLoop, captures: list[str] | None = None
+) -> list[Case]:
+    """Return all benchmark cases, with a replay case per capture file."""
+    spin = knob_spin(500)
+    return [
+        _received_case("data_received.mp60_dump", MP60_STATE_DUMP),
+        _received_case("data_received.knob_spin", spin),
+        _parse_case("parse_message.mp60_dump", DeviceModel.MP60, MP60_STATE_DUMP),
+        _parse_case(
+            "parse_message.tdai3400_dump", DeviceModel.TDAI3400, TDAI3400_STATE_DUMP
+        ),
+        _parse_case("parse_message.knob_spin", DeviceModel.MP60, spin),
+        _callbacks_case(
+            "run_callbacks.mp60_dump", DeviceModel.MP60, MP60_STATE_DUMP, loop
+        ),
+        _callbacks_case(
+            "run_callbacks.tdai3400_dump",
+            DeviceModel.TDAI3400,
+            TDAI3400_STATE_DUMP,
+            loop,
+        ),
+        _callbacks_case("run_callbacks.knob_spin", DeviceModel.MP60, spin, loop),
+        _media_data_case(),
+        _media_update_case(loop),
+        *_poll_batch_cases(loop),
+        *_volume_cases(spin),
+        *(_replay_case(path, loop) for path in captures or ()),
+    ]
+
+
+def measure(case: Case, min_time: float) -> Result:
+    """
+    Time a case for at least min_time and trace its memory.
+
+    The memory is the peak of traced bytes above the level before a run,
+    averaged over a few runs. It is not a count of allocations, which
+    tracemalloc does not keep.
+    """
+    case.run()  # Warm up caches and lazily built state
+
+    rounds, elapsed = 0, 0.0
+    started = time.perf_counter()
+    while elapsed < min_time:
+        case.run()
+        rounds += 1
+        elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    peak = 0
+    for _ in range(_MEMORY_ROUNDS):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        case.run()
+        peak += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+
+    ops_per_sec = rounds / elapsed
+    return Result(
+        name=case.name,
+        items=case.items,
+        ops_per_sec=ops_per_sec,
+        items_per_sec=ops_per_sec * case.items,
+        peak_bytes_per_op=peak / _MEMORY_ROUNDS,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--json", metavar="PATH", help="write the results as JSON")
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=_MIN_TIME,
+        help="seconds to run each case (default: %(default)s)",
+    )
+    parser.add_argument("-k", dest="filter", help="only run cases containing this")
+    parser.add_argument(
+        "--capture",
+        metavar="PATH",
+        action="append",
+        help="also replay a capture of pylyngdorf.capture (repeatable)",
+    )
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    try:
+        cases = build_cases(loop, args.capture)
+        if args.filter:
+            cases = [case for case in cases if args.filter in case.name]
+        results = [measure(case, args.min_time) for case in cases]
+    finally:
+        loop.close()
+
+    print(f"{'case':<32} {'items':>6} {'ops/s':>12} {'items/s':>14} {'peak B/op':>10}")
+    for result in results:
+        print(
+            f"{result.name:<32} {result.items:>6} {result.ops_per_sec:>12,.0f} "
+            f"{result.items_per_sec:>14,.0f} {result.peak_bytes_per_op:>10,.0f}"
+        )
+
+    if args.json:
+        report = {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "results": [attr.asdict(result) for result in results],
+        }
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
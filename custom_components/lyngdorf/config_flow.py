@@ -12,7 +12,7 @@ import voluptuous as vol
 
 from .pylyngdorf.const import DEFAULT_PORT
 from .pylyngdorf.exceptions import LyngdorfNetworkError, LyngdorfTimoutError
-from .pylyngdorf.lyngdorf import Lyngdorf
+from .pylyngdorf.probe import async_probe_model
 
 from .const import DOMAIN
 
@@ -138,12 +138,8 @@ class LyngdorfConfigFlow(ConfigFlow, domain=DOMAIN):
 
         try:
             port = cast(int, self.port)
-            receiver: Lyngdorf = Lyngdorf.create(self.host, port)
 
-            await receiver.async_connect()
-            await receiver.async_disconnect()
-
-            if not (model := receiver.model):
+            if not (model := await async_probe_model(self.host, port)):
                 errors["base"] = "unsupported"
             else:
                 self.name = model.value
@@ -6,3 +6,6 @@ from typing import Final
 
 NAME: Final = "Lyngdorf"
 DOMAIN: Final = "lyngdorf"
+
+# Confirmed commands kept in flight on the control connection
+PIPELINE_WINDOW: Final = 4
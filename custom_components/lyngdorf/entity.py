@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import datetime as dt
 import logging
+import time
 from typing import TYPE_CHECKING
 
 from homeassistant.const import CONF_IP_ADDRESS, CONF_MODEL, CONF_NAME, CONF_PORT
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
@@ -19,10 +21,10 @@ from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN as LYNGDORF_DOMAIN
 from .const import NAME as LYNGDORF_NAME
+from .const import PIPELINE_WINDOW
 from .pylyngdorf.const import DeviceModel, DEFAULT_PORT, LyngdorfQuery
 from .pylyngdorf.exceptions import LyngdorfNetworkError, LyngdorfTimoutError
 from .pylyngdorf.lyngdorf import Lyngdorf
-from .pylyngdorf.music_player import MediaState
 
 
 if TYPE_CHECKING:
@@ -54,6 +56,8 @@ class LyngdorfCoordinator(DataUpdateCoordinator[None]):
             self.host,
             self.port,
             device_model=self.model,
+            pipeline_window=PIPELINE_WINDOW,
+            session=async_get_clientsession(hass),
         )
 
         self._media_position_updated_at: dt.datetime | None = None
@@ -79,14 +83,16 @@ class LyngdorfCoordinator(DataUpdateCoordinator[None]):
         """No polling needed."""
         return self.data
 
-    def _notify_callback(self, event: LyngdorfQuery) -> None:
-        """Handle a notification."""
-        self._media_position_updated_at = (
-            dt_util.utcnow()
-            if event == LyngdorfQuery.MEDIA_DATA
-            and self.receiver.media_data.state != MediaState.STOPPED
-            else None
-        )
+    def _notify_callback(self, events: frozenset[LyngdorfQuery]) -> None:
+        """Handle a batch of notifications."""
+        if LyngdorfQuery.MEDIA_DATA in events:
+            # The library extrapolates the position from a monotonic anchor
+            anchor = self.receiver.media_data.position_updated_at
+            self._media_position_updated_at = (
+                dt_util.utcnow() - dt.timedelta(seconds=time.monotonic() - anchor)
+                if anchor is not None
+                else None
+            )
 
         self.async_update_listeners()
 
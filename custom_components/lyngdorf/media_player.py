@@ -18,12 +18,15 @@ from homeassistant.components.media_player.const import (
     MediaType,
     RepeatMode,
 )
+from homeassistant.core import ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import entity_platform
 
 
-from .pylyngdorf.const import MIN_VOLUME_DB
+from .pylyngdorf.const import MIN_VOLUME_DB, LyngdorfSetting
 from .pylyngdorf.music_player import MediaState, RepeatMode as LyngdorfRepeatMode
+from .pylyngdorf.snapshot import DeviceSnapshot
 
 from .entity import LyngdorfCoordinator, LyngdorfEntity
 
@@ -58,6 +61,25 @@ ATTR_VOLUME_MIN_DB = "volume_min_db"
 ATTR_VOLUME_MAX_DB = "volume_max_db"
 
 SERVICE_SET_VOLUME_DB = "set_volume_db"
+SERVICE_APPLY_SETTINGS = "apply_settings"
+SERVICE_SNAPSHOT = "snapshot"
+SERVICE_RESTORE = "restore"
+
+APPLY_SETTINGS_SCHEMA = {
+    vol.Optional(LyngdorfSetting.SOURCE.value): cv.string,
+    vol.Optional(LyngdorfSetting.AUDIO_MODE.value): cv.string,
+    vol.Optional(LyngdorfSetting.VOICING.value): cv.string,
+    vol.Optional(LyngdorfSetting.FOCUS_POSITION.value): cv.string,
+    vol.Optional(LyngdorfSetting.LIPSYNC.value): vol.Coerce(int),
+    vol.Optional(LyngdorfSetting.BASS_TRIM.value): vol.Coerce(float),
+    vol.Optional(LyngdorfSetting.TREBLE_TRIM.value): vol.Coerce(float),
+    vol.Optional(LyngdorfSetting.CENTER_TRIM.value): vol.Coerce(float),
+    vol.Optional(LyngdorfSetting.HEIGHTS_TRIM.value): vol.Coerce(float),
+    vol.Optional(LyngdorfSetting.LFE_TRIM.value): vol.Coerce(float),
+    vol.Optional(LyngdorfSetting.SURROUNDS_TRIM.value): vol.Coerce(float),
+    vol.Optional(LyngdorfSetting.MUTE.value): cv.boolean,
+    vol.Optional(LyngdorfSetting.VOLUME.value): vol.Coerce(float),
+}
 
 MEDIA_PLAYER_STATE_MAP = {
     MediaState.BUFFERING: MediaPlayerState.BUFFERING,
@@ -88,9 +110,29 @@ async def async_setup_entry(
     platform = entity_platform.async_get_current_platform()
     platform.async_register_entity_service(
         SERVICE_SET_VOLUME_DB,
-        cv.make_entity_service_schema({vol.Required("volume"): vol.Coerce(float)}),
+        cv.make_entity_service_schema(
+            {
+                vol.Required("volume"): vol.Coerce(float),
+                vol.Optional("duration"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+            }
+        ),
         "async_set_volume_db",
     )
+    platform.async_register_entity_service(
+        SERVICE_APPLY_SETTINGS,
+        cv.make_entity_service_schema(APPLY_SETTINGS_SCHEMA),
+        "async_apply_settings",
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    platform.async_register_entity_service(
+        SERVICE_SNAPSHOT, cv.make_entity_service_schema({}), "async_snapshot"
+    )
+    platform.async_register_entity_service(
+        SERVICE_RESTORE,
+        cv.make_entity_service_schema({}),
+        "async_restore",
+        supports_response=SupportsResponse.OPTIONAL,
+    )
 
 
 class LyngdorfMediaPlayer(LyngdorfEntity, MediaPlayerEntity):
@@ -109,6 +151,7 @@ class LyngdorfMediaPlayer(LyngdorfEntity, MediaPlayerEntity):
             self._receiver.multichannel and MediaPlayerEntityFeature.SELECT_SOUND_MODE
         )
         self._optimistic_volume: float | None = None
+        self._snapshot: DeviceSnapshot | None = None
 
     @property
     def state(self) -> MediaPlayerState | None:
@@ -143,7 +186,7 @@ class LyngdorfMediaPlayer(LyngdorfEntity, MediaPlayerEntity):
     @property
     def source_list(self) -> list[str] | None:
         """Return list of available input sources."""
-        return self._receiver.sources
+        return list(self._receiver.sources)
 
     @property
     def sound_mode(self) -> str | None:
@@ -153,7 +196,7 @@ class LyngdorfMediaPlayer(LyngdorfEntity, MediaPlayerEntity):
     @property
     def sound_mode_list(self) -> list[str] | None:
         """Return list of available sound modes."""
-        return self._receiver.audio_modes
+        return list(self._receiver.audio_modes)
 
     @property
     def shuffle(self) -> bool | None:
@@ -253,16 +296,43 @@ class LyngdorfMediaPlayer(LyngdorfEntity, MediaPlayerEntity):
         self.async_write_ha_state()
 
         try:
-            await self._receiver.async_set_volume_level(volume)
+            await self._receiver.async_ramp_volume_level(volume)
         except Exception as err:
             _LOGGER.error("Failed to set volume: %s", err, exc_info=True)
             self._optimistic_volume = None
             self.async_write_ha_state()
             raise
 
-    async def async_set_volume_db(self, volume: float) -> None:
-        """Set volume in decibels."""
-        await self._receiver.async_set_volume(volume)
+    async def async_set_volume_db(
+        self, volume: float, duration: float | None = None
+    ) -> None:
+        """Set volume in decibels, ramping over duration seconds if given."""
+        if duration:
+            await self._receiver.async_ramp_volume(volume, duration)
+        else:
+            await self._receiver.async_set_volume(volume)
+
+    async def async_apply_settings(self, **settings: Any) -> ServiceResponse:
+        """Apply several settings in one batch, returning which were confirmed."""
+        try:
+            results = await self._receiver.async_apply_settings(settings)
+        except ValueError as err:
+            raise ServiceValidationError(str(err)) from err
+        return {setting.value: confirmed for setting, confirmed in results.items()}
+
+    async def async_snapshot(self) -> None:
+        """Save the current settings for a later restore."""
+        self._snapshot = self._receiver.snapshot()
+
+    async def async_restore(self) -> ServiceResponse:
+        """Restore the saved settings, returning which were confirmed."""
+        if self._snapshot is None:
+            raise ServiceValidationError("No snapshot to restore")
+        try:
+            results = await self._receiver.async_restore(self._snapshot)
+        except ValueError as err:
+            raise ServiceValidationError(str(err)) from err
+        return {setting.value: confirmed for setting, confirmed in results.items()}
 
     async def async_mute_volume(self, mute: bool) -> None:
         """Mute/unmute player volume."""
@@ -6,55 +6,48 @@ Module implements API for Lyngdorf devices.
 """
 
 import asyncio
+import collections
 import contextlib
 import logging
-import re
 import time
-from collections.abc import Awaitable, Callable
-from typing import Any, Final
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any
 
 import attr
 
 from .config import DeviceProtocol
 from .const import (
+    BOOTSTRAP_TIMEOUT,
     COMMAND_PREFIX,
     DEFAULT_PORT,
     ECHO_PREFIX,
+    EVENT_QUEUE_LIMIT,
     LYNGDORF_ATTR_SETATTR,
+    MIN_EVENT_QUEUE_LIMIT,
     MIN_MESSAGE_LENGTH,
     MONITOR_INTERVAL,
+    PIPELINE_WINDOW,
     RECONNECT_BACKOFF,
     RECONNECT_MAX_WAIT,
     RECONNECT_SCALE,
+    RESYNC_ATTEMPTS,
+    TRAFFIC_RECEIVED,
+    TRAFFIC_SENT,
     LyngdorfCommand,
     LyngdorfQuery,
 )
+from .dispatcher import DispatchStats, EventDispatcher
 from .exceptions import (
     LyngdorfNetworkError,
     LyngdorfProcessingError,
     LyngdorfTimoutError,
 )
+from .framer import LineFramer, LineFramerStats
+from .ledger import CommandLatency, ConfirmationLedger, PendingConfirmation
+from .parser import Decoder, LyngdorfParsedMessage, parse_message, tokenize_message
 
 _LOGGER = logging.getLogger(__name__)
 
-_MESSAGE_PATTERN: Final = re.compile(
-    f"^[{COMMAND_PREFIX}{ECHO_PREFIX}]"  # Must start with '!' or '#'
-    r"(?P<cmd>\w+)"  # Command name
-    r"\??"  # Optional '?'
-    r"(?:\((?P<params>[^\)]*)\))?"  # Optional (param1,param2)
-    r"(?:\"(?P<string>[^\"]*)\")?"  # Optional "string"
-)
-
-_SPLIT_PARAMS: Final = re.compile(r'"(.*?)"|([^,]+)')
-
-
-@attr.define(auto_attribs=True, frozen=True)
-class LyngdorfParsedMessage:
-    """Represents a parsed message from the Lyngdorf protocol."""
-
-    event: str
-    params: list[str]
-
 
 class LyngdorfProtocol(asyncio.Protocol):
     """Protocol for the Lyngdorf interface."""
@@ -65,9 +58,8 @@ class LyngdorfProtocol(asyncio.Protocol):
         on_connection_lost: Callable[[], None],
     ) -> None:
         """Initialise the protocol."""
-        self._buffer = b""
+        self.framer = LineFramer(on_message)
         self.transport: asyncio.Transport | None = None
-        self._on_message = on_message
         self._on_connection_lost = on_connection_lost
 
     @property
@@ -90,11 +82,7 @@ class LyngdorfProtocol(asyncio.Protocol):
 
     def data_received(self, data: bytes) -> None:
         """Handle data received."""
-        self._buffer += data
-        while any(sep in self._buffer for sep in (b"\r", b"\n")):
-            line, self._buffer = re.split(b"[\r\n]+", self._buffer, maxsplit=1)
-            with contextlib.suppress(UnicodeDecodeError):
-                self._on_message(line.decode("utf-8"))
+        self.framer.feed(data)
 
     def connection_made(self, transport: asyncio.BaseTransport) -> None:
         """Handle connection made."""
@@ -114,36 +102,63 @@ class LyngdorfApi:
     host: str = attr.field(converter=str, default="localhost")
     port: int = attr.field(converter=int, default=DEFAULT_PORT)
     timeout: float = attr.field(converter=float, default=2.0)
+    pipeline_window: int = attr.field(
+        converter=int, default=PIPELINE_WINDOW, validator=attr.validators.ge(1)
+    )
+    batch_bootstrap: bool = attr.field(default=True)
+    event_queue_limit: int = attr.field(
+        converter=int,
+        default=EVENT_QUEUE_LIMIT,
+        validator=attr.validators.ge(MIN_EVENT_QUEUE_LIMIT),
+    )
     _connection_enabled: bool = attr.field(default=False)
     _connection_disabled_event: asyncio.Event = attr.field(init=False)
     _last_message_time: float = attr.field(default=-1.0)
     _connect_lock: asyncio.Lock = attr.field(default=attr.Factory(asyncio.Lock))
     _reconnect_task: asyncio.Task[Any] | None = attr.field(default=None)
     _monitor_task: asyncio.Task[Any] | None = attr.field(default=None)
+    _resync_task: asyncio.Task[Any] | None = attr.field(default=None)
+    _resync_again: bool = attr.field(default=False, init=False)
     _protocol: LyngdorfProtocol | None = attr.field(default=None)
-    _callback_tasks: set[asyncio.Task[Any]] = attr.field(factory=lambda: set())
+    _dispatcher: EventDispatcher = attr.field(init=False)
     _send_lock: asyncio.Lock = attr.field(default=attr.Factory(asyncio.Lock))
     _send_confirmation_timeout: float = attr.field(converter=float, default=0.5)
-    _pending_confirmations: dict[str, asyncio.Future[None]] = attr.field(
-        factory=dict[str, asyncio.Future[None]]
+    _in_flight: int = attr.field(default=0, init=False)
+    _slot_waiters: collections.deque[asyncio.Future[None]] = attr.field(
+        factory=collections.deque, init=False
     )
+    _ledger: ConfirmationLedger = attr.field(factory=ConfirmationLedger)
+    _bootstrap_duration: float | None = attr.field(default=None, init=False)
+    _bootstrap_missing: tuple[str, ...] = attr.field(default=(), init=False)
     _send_tasks: set[asyncio.Task[Any]] = attr.field(factory=lambda: set())
-    _callbacks: dict[str, list[Callable[[str, list[str]], Awaitable[None]]]] = (
-        attr.field(factory=dict[str, list[Callable[[str, list[str]], Awaitable[None]]]])
+    _callbacks: dict[str, list[Callable[[str, list[Any]], Awaitable[None]]]] = (
+        attr.field(factory=dict[str, list[Callable[[str, list[Any]], Awaitable[None]]]])
     )
+    _decoders: dict[tuple[str, Callable[..., Any]], Decoder] = attr.field(factory=dict)
     _raw_callbacks: list[Callable[[str], Awaitable[None]]] = attr.field(
         factory=list[Callable[[str], Awaitable[None]]]
     )
+    _recorder: Callable[[str, str], None] | None = attr.field(default=None, init=False)
 
     def __attrs_post_init__(self) -> None:
         """Initialise special attributes."""
-        self._register_raw_callback(self._async_send_confirmation_callback)
+        self._dispatcher = EventDispatcher(
+            self._async_run_callbacks,
+            limit=self.event_queue_limit,
+            on_overflow=self._handle_overflow,
+        )
 
-    async def async_connect(self) -> None:
-        """Connect to the processor asynchronously."""
+    async def async_connect(self, resync: bool = False) -> None:
+        """
+        Connect to the processor asynchronously.
+
+        With resync, the state is queried again when already connected.
+        """
         _LOGGER.debug("%s: connecting", self.host)
         async with self._connect_lock:
             if self.connected:
+                if resync and self.healthy:
+                    await self._async_bootstrap()
                 return
             await self._async_establish_connection()
 
@@ -192,12 +207,98 @@ class LyngdorfApi:
         cmd = self.device_protocol.commands.get_command(LyngdorfCommand.VERBOSE)
         await self._async_send_command(cmd.format(2), skip_confirmation=True)
         await asyncio.sleep(0.1)
-        await self.async_send_commands(
-            *self.device_protocol.queries.values(),
-            raise_on_error=False,
-            confirmation_timeout=2.0,
+        await self._async_bootstrap()
+
+    async def _async_bootstrap(self) -> None:
+        """Query the complete state of the processor."""
+        queries = tuple(self.device_protocol.queries.values())
+        started = time.monotonic()
+        if self.batch_bootstrap:
+            self._bootstrap_missing = await self._async_send_batch(
+                queries, BOOTSTRAP_TIMEOUT
+            )
+        else:
+            self._bootstrap_missing = ()
+            await self.async_send_commands(
+                *queries,
+                raise_on_error=False,
+                confirmation_timeout=2.0,
+            )
+        self._bootstrap_duration = time.monotonic() - started
+
+        if self._bootstrap_missing:
+            _LOGGER.warning(
+                "%s: No answer to queries: %s",
+                self.host,
+                ", ".join(self._bootstrap_missing),
+            )
+        _LOGGER.debug(
+            "%s: State synchronised in %.3fs", self.host, self._bootstrap_duration
         )
 
+    def _handle_overflow(self) -> None:
+        """Query the complete state again after events were dropped."""
+        if self._resync_task is not None:
+            # Events of the running resync were dropped, run it once more
+            self._resync_again = True
+        elif self.connected:
+            self._resync_task = asyncio.create_task(self._async_resync())
+
+    async def _async_resync(self) -> None:
+        """Query the complete state of the processor until none is dropped."""
+        try:
+            attempts, self._resync_again = 0, True
+            while self._resync_again and attempts < RESYNC_ATTEMPTS:
+                self._resync_again = False
+                attempts += 1
+                await self._async_bootstrap()
+            if self._resync_again:
+                _LOGGER.warning(
+                    "%s: Events still dropped after %d resyncs", self.host, attempts
+                )
+        except LyngdorfProcessingError as err:
+            _LOGGER.debug("%s: Resync failed: %s", self.host, err)
+        finally:
+            self._resync_task = None
+
+    async def _async_send_batch(
+        self, commands: tuple[str, ...], timeout: float
+    ) -> tuple[str, ...]:
+        """
+        Write commands in a single write and wait for all of their echoes.
+
+        Return the commands that were not confirmed within the timeout.
+        """
+        async with self._send_lock:
+            self._check_connection(", ".join(commands))
+            entries = [self._ledger.register(command) for command in commands]
+            self._write_commands(*commands)
+
+        outstanding = {entry.seq for entry in entries}
+        synced: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+        def _on_echo(entry: PendingConfirmation) -> None:
+            if entry.future.cancelled():
+                return
+            outstanding.discard(entry.seq)
+            if not outstanding and not synced.done():
+                synced.set_result(None)
+
+        for entry in entries:
+            entry.future.add_done_callback(lambda _, entry=entry: _on_echo(entry))
+        if not outstanding:
+            synced.set_result(None)
+
+        try:
+            await asyncio.wait_for(synced, timeout=timeout)
+        except TimeoutError:
+            pass
+        finally:
+            for entry in entries:
+                self._ledger.expire(entry, timed_out=entry.seq in outstanding)
+
+        return tuple(entry.command for entry in entries if entry.seq in outstanding)
+
     def _stop_monitor(self) -> None:
         """Stop the monitor task."""
         if self._monitor_task is not None:
@@ -251,6 +352,9 @@ class LyngdorfApi:
 
             self._stop_monitor()
             reconnect_task = self._reconnect_task
+            if self._resync_task is not None:
+                self._resync_task.cancel()
+                self._resync_task = None
             if self._reconnect_task is not None:
                 self._reconnect_task.cancel()
                 self._reconnect_task = None
@@ -261,6 +365,7 @@ class LyngdorfApi:
             if reconnect_task is not None:
                 with contextlib.suppress(asyncio.CancelledError):
                     await reconnect_task
+            await self._dispatcher.async_stop()
             _LOGGER.debug("%s: Disconnected", self.host)
 
     async def _async_reconnect(self) -> None:
@@ -299,22 +404,42 @@ class LyngdorfApi:
         self._reconnect_task = None
 
     def register_callback(
-        self, event: str, callback: Callable[[str, list[str]], Awaitable[None]]
+        self,
+        event: str,
+        callback: Callable[[str, list[Any]], Awaitable[None]],
+        decoder: Decoder | None = None,
     ) -> None:
-        """Register a callback handler for an event type."""
+        """
+        Register a callback handler for an event type.
+
+        With a decoder, the callback receives the decoded parameters of the
+        event instead of the raw strings. Other callbacks of the event are not
+        affected.
+        """
         if event not in self._callbacks:
             self._callbacks[event] = []
         elif callback in self._callbacks[event]:
             return
         self._callbacks[event].append(callback)
+        if decoder is not None:
+            self._decoders[(event, callback)] = decoder
 
     def unregister_callback(
-        self, event: str, callback: Callable[[str, list[str]], Awaitable[None]]
+        self, event: str, callback: Callable[[str, list[Any]], Awaitable[None]]
     ) -> None:
         """Unregister a callback handler for an event type."""
         if event not in self._callbacks:
             return
         self._callbacks[event].remove(callback)
+        self._decoders.pop((event, callback), None)
+
+    def set_recorder(self, recorder: Callable[[str, str], None] | None) -> None:
+        """
+        Set a hook called with the direction and every line sent or received.
+
+        See capture.TrafficRecorder, None removes the hook.
+        """
+        self._recorder = recorder
 
     def _register_raw_callback(
         self, callback: Callable[[str], Awaitable[None]]
@@ -332,35 +457,21 @@ class LyngdorfApi:
 
     def _parse_message(self, message: str) -> LyngdorfParsedMessage | None:
         """Parse a message string into an event name and list of parameters."""
-        match = _MESSAGE_PATTERN.match(message)
-        if not match:
-            _LOGGER.debug("Not matched %s", message)
-            return None
-
-        command = match.group("cmd")
-        params_raw = match.group("params")
-        trailing = match.group("string")
-
-        def _split_params(s: str) -> list[str]:
-            return [m[0] or m[1].strip() for m in re.findall(_SPLIT_PARAMS, s)]
-
-        params = _split_params(params_raw) if params_raw else []
-        if trailing is not None:
-            params.append(trailing)
-
-        return LyngdorfParsedMessage(command, params)
+        return tokenize_message(message) or parse_message(message)
 
     def _process_message(self, message: str) -> None:
         """Process event."""
         _LOGGER.debug("Incoming message: %s", message)
         self._last_message_time = time.monotonic()
+        if self._recorder is not None:
+            self._recorder(TRAFFIC_RECEIVED, message)
+        # Confirm inline, a callback may be waiting for the echo of a command
+        self._confirm_command(message)
         parsed_message = self._parse_message(message)
         if parsed_message is None:
             return
 
-        task = asyncio.create_task(self._async_run_callbacks(message, parsed_message))
-        self._callback_tasks.add(task)
-        task.add_done_callback(self._callback_tasks.discard)
+        self._dispatcher.put(message, parsed_message)
 
     async def _async_run_callbacks(
         self, message: str, parsed_message: LyngdorfParsedMessage
@@ -380,9 +491,26 @@ class LyngdorfApi:
 
         if message.startswith(COMMAND_PREFIX):
             if parsed_message.event in self._callbacks:
-                for callback in self._callbacks[parsed_message.event]:
+                event, raw_params = parsed_message
+                # Decode once per decoder, callbacks may share one
+                decoded: dict[Decoder, list[Any]] = {}
+                for callback in self._callbacks[event]:
+                    params = raw_params
+                    if (decoder := self._decoders.get((event, callback))) is not None:
+                        if decoder not in decoded:
+                            try:
+                                decoded[decoder] = decoder(raw_params)
+                            except ValueError:
+                                _LOGGER.debug(
+                                    "%s: Invalid parameters for %s in %s",
+                                    self.host,
+                                    callback,
+                                    message,
+                                )
+                                continue
+                        params = decoded[decoder]
                     try:
-                        await callback(parsed_message.event, parsed_message.params)
+                        await callback(event, params)
                     except Exception as err:
                         # We don't want a single bad callback to trip up the
                         # whole system and prevent further execution
@@ -396,8 +524,88 @@ class LyngdorfApi:
         """Send a command to the processor."""
         if self._protocol:
             self._protocol.write(f"{COMMAND_PREFIX}{command}\r")
+            if self._recorder is not None:
+                self._recorder(TRAFFIC_SENT, f"{COMMAND_PREFIX}{command}")
             _LOGGER.debug("%s send: %s%s", self.host, COMMAND_PREFIX, command)
 
+    def _write_commands(self, *commands: str) -> None:
+        """Send several commands to the processor in a single write."""
+        if self._protocol:
+            self._protocol.write(
+                "".join(f"{COMMAND_PREFIX}{command}\r" for command in commands)
+            )
+            if self._recorder is not None:
+                for command in commands:
+                    self._recorder(TRAFFIC_SENT, f"{COMMAND_PREFIX}{command}")
+            _LOGGER.debug("%s send batch: %s", self.host, ", ".join(commands))
+
+    async def _async_acquire_slot(self) -> None:
+        """Wait for a free slot in the in-flight window."""
+        while self._in_flight >= self.pipeline_window:
+            waiter = asyncio.get_running_loop().create_future()
+            self._slot_waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Pass the wake-up on to the next waiter
+                    self._wake_slot_waiter()
+                raise
+            finally:
+                with contextlib.suppress(ValueError):
+                    self._slot_waiters.remove(waiter)
+        self._in_flight += 1
+
+    def _release_slot(self) -> None:
+        """Free a slot in the in-flight window."""
+        self._in_flight -= 1
+        self._wake_slot_waiter()
+
+    def _wake_slot_waiter(self) -> None:
+        """Wake the longest waiting sender."""
+        for waiter in self._slot_waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    def _check_connection(self, command: str) -> None:
+        """Raise if a command cannot be sent."""
+        if not self.connected or not self.healthy:
+            raise LyngdorfProcessingError(
+                f"Error sending command {command}: "
+                f"Connected: {self.connected}, Connection healthy: {self.healthy}"
+            )
+
+    async def _async_write_confirmed(self, command: str) -> PendingConfirmation:
+        """Write a command and return its entry in the confirmation ledger."""
+        async with self._send_lock:
+            self._check_connection(command)
+            entry = self._ledger.register(command)
+            self._write_command(command)
+        return entry
+
+    async def _async_wait_confirmation(
+        self,
+        entry: PendingConfirmation,
+        raise_on_error: bool,
+        confirmation_timeout: float | None,
+    ) -> None:
+        """Wait for the echo of a command and release its window slot."""
+        try:
+            await asyncio.wait_for(
+                entry.future,
+                timeout=confirmation_timeout or self._send_confirmation_timeout,
+            )
+        except TimeoutError as err:
+            self._ledger.expire(entry)
+            msg = f"Timeout waiting for confirmation of command: {entry.command}"
+            _LOGGER.warning(msg)
+            if raise_on_error:
+                raise LyngdorfProcessingError(msg) from err
+        finally:
+            self._ledger.expire(entry, timed_out=False)
+            self._release_slot()
+
     async def _async_send_command(
         self,
         command: str,
@@ -406,44 +614,65 @@ class LyngdorfApi:
         confirmation_timeout: float | None = None,
     ) -> None:
         """Send a command and wait for confirmation unless skipped."""
-        async with self._send_lock:
-            if not self.connected or not self.healthy:
-                raise LyngdorfProcessingError(
-                    f"Error sending command {command}: "
-                    f"Connected: {self.connected}, Connection healthy: {self.healthy}"
-                )
-
-            future: asyncio.Future[None] | None = None
-            if not skip_confirmation:
-                future = asyncio.get_running_loop().create_future()
-                self._pending_confirmations[command] = future
+        if skip_confirmation:
+            async with self._send_lock:
+                self._check_connection(command)
+                self._write_command(command)
+            return
 
-            self._write_command(command)
+        await self._async_acquire_slot()
+        try:
+            entry = await self._async_write_confirmed(command)
+        except BaseException:
+            self._release_slot()
+            raise
+        await self._async_wait_confirmation(entry, raise_on_error, confirmation_timeout)
 
-            if future:
+    async def _async_send_pipelined(
+        self,
+        commands: tuple[str, ...],
+        raise_on_error: bool,
+        confirmation_timeout: float | None,
+    ) -> None:
+        """Send commands in order, keeping up to the window size in flight."""
+        waiters: list[asyncio.Task[None]] = []
+        try:
+            for command in commands:
+                await self._async_acquire_slot()
+                if raise_on_error and any(
+                    waiter.done() and not waiter.cancelled() and waiter.exception()
+                    for waiter in waiters
+                ):
+                    self._release_slot()
+                    break
                 try:
-                    await asyncio.wait_for(
-                        future,
-                        timeout=confirmation_timeout or self._send_confirmation_timeout,
+                    entry = await self._async_write_confirmed(command)
+                except BaseException:
+                    self._release_slot()
+                    raise
+                waiters.append(
+                    asyncio.create_task(
+                        self._async_wait_confirmation(
+                            entry, raise_on_error, confirmation_timeout
+                        )
                     )
-                except TimeoutError as err:
-                    msg = f"Timeout waiting for confirmation of command: {command}"
-                    _LOGGER.warning(msg)
-                    if raise_on_error:
-                        raise LyngdorfProcessingError(msg) from err
-                finally:
-                    self._pending_confirmations.pop(command, None)
-
-    async def _async_send_confirmation_callback(self, message: str) -> None:
+                )
+        finally:
+            results = await asyncio.gather(*waiters, return_exceptions=True)
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    def _confirm_command(self, message: str) -> None:
         """Confirm that the command has been executed."""
         if len(message) < MIN_MESSAGE_LENGTH or not message.startswith(ECHO_PREFIX):
             return
 
         command = message[1:]
-        future = self._pending_confirmations.pop(command, None)
-        if future and not future.done():
-            future.set_result(None)
-            _LOGGER.debug("Command %s confirmed", command)
+        entry = self._ledger.confirm(command)
+        if entry is not None and not entry.future.cancelled():
+            _LOGGER.debug("Command %s (#%d) confirmed", command, entry.seq)
 
     async def async_send_commands(
         self,
@@ -453,6 +682,12 @@ class LyngdorfApi:
         confirmation_timeout: float | None = None,
     ) -> None:
         """Send commands to the processor."""
+        if self.pipeline_window > 1 and not skip_confirmation and len(commands) > 1:
+            await self._async_send_pipelined(
+                commands, raise_on_error, confirmation_timeout
+            )
+            return
+
         for command in commands:
             await self._async_send_command(
                 command,
@@ -461,6 +696,21 @@ class LyngdorfApi:
                 confirmation_timeout=confirmation_timeout,
             )
 
+    async def async_send_batch(
+        self, *commands: str, confirmation_timeout: float | None = None
+    ) -> tuple[str, ...]:
+        """
+        Send commands in a single write and wait for all of their echoes.
+
+        Return the commands that were not confirmed, once the events received
+        until then have run their callbacks.
+        """
+        missing = await self._async_send_batch(
+            commands, confirmation_timeout or self.timeout
+        )
+        await self._dispatcher.async_join()
+        return missing
+
     def send_commands(
         self,
         *commands: str,
@@ -496,3 +746,39 @@ class LyngdorfApi:
     def healthy(self) -> bool:
         """Return True if connection is healthy."""
         return self._protocol is not None and self._protocol.connected
+
+    @property
+    def confirmation_stats(self) -> Mapping[str, CommandLatency]:
+        """Return the confirmation latency statistics per command name."""
+        return self._ledger.latency
+
+    def slowest_commands(self, count: int = 5) -> list[tuple[str, CommandLatency]]:
+        """Return the command names with the highest mean confirmation latency."""
+        return self._ledger.slowest(count)
+
+    @property
+    def bootstrap_duration(self) -> float | None:
+        """Return the seconds the last state synchronisation took."""
+        return self._bootstrap_duration
+
+    @property
+    def bootstrap_missing(self) -> tuple[str, ...]:
+        """Return the queries left unanswered by the last state synchronisation."""
+        return self._bootstrap_missing
+
+    @property
+    def dispatch_queue_depth(self) -> int:
+        """Return the number of messages waiting for their callbacks."""
+        return self._dispatcher.depth
+
+    @property
+    def dispatch_stats(self) -> DispatchStats:
+        """Return the counters and latency of the event dispatcher."""
+        return self._dispatcher.stats
+
+    @property
+    def framer_stats(self) -> LineFramerStats | None:
+        """Return the line framer counters of the current connection."""
+        if self._protocol is None:
+            return None
+        return self._protocol.framer.stats
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Module implements capture and replay of Lyngdorf protocol traffic.
+
+:license: MIT, see LICENSE for more details.
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from collections.abc import Iterator
+from typing import IO, Final, NamedTuple, Self
+
+import attr
+
+from .api import LyngdorfApi
+from .const import TRAFFIC_RECEIVED, TRAFFIC_SENT, DeviceModel
+from .device import LyngdorfDevice
+from .lyngdorf import Lyngdorf
+
+_LOGGER = logging.getLogger(__name__)
+
+CAPTURE_HEADER: Final = "LYNGDORF-CAPTURE 1"
+
+
+class CapturedLine(NamedTuple):
+    """A line of captured traffic, timed in seconds from the capture start."""
+
+    time: float
+    direction: str
+    line: str
+
+
+@attr.define
+class TrafficRecorder:
+    """
+    Append the lines of a connection to a capture file.
+
+    Every recording session starts with a header line, followed by one line
+    per record: the microseconds since the previous record, a tab, the
+    direction ('<' received, '>' sent) and the line as on the wire.
+    Install it with LyngdorfApi.set_recorder().
+    """
+
+    path: str = attr.field()
+    records: int = attr.field(default=0, init=False)
+    _file: IO[str] = attr.field(init=False)
+    _last: float | None = attr.field(default=None, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        """Open the capture file and start a session."""
+        self._file = open(self.path, "a", encoding="utf-8")  # noqa: SIM115
+        self._file.write(f"{CAPTURE_HEADER}\n")
+
+    def __call__(self, direction: str, line: str) -> None:
+        """Record a line."""
+        now = time.monotonic()
+        delta = 0 if self._last is None else round((now - self._last) * 1_000_000)
+        self._last = now
+        self._file.write(f"{delta}\t{direction}{line}\n")
+        self.records += 1
+
+    def flush(self) -> None:
+        """Write buffered records to the file."""
+        self._file.flush()
+
+    def close(self) -> None:
+        """Close the capture file."""
+        self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def read_capture(path: str) -> Iterator[CapturedLine]:
+    """Read the lines of a capture file, sessions following each other."""
+    elapsed = 0.0
+    with open(path, encoding="utf-8") as file:
+        header = file.readline().rstrip("\n")
+        if header != CAPTURE_HEADER:
+            raise ValueError(f"{path} is not a Lyngdorf capture")
+        for number, record in enumerate(file, start=2):
+            record = record.rstrip("\n")
+            if record == CAPTURE_HEADER:
+                continue
+            delta, separator, line = record.partition("\t")
+            if not separator or line[:1] not in (TRAFFIC_RECEIVED, TRAFFIC_SENT):
+                raise ValueError(f"{path}:{number}: invalid record")
+            elapsed += int(delta) / 1_000_000
+            yield CapturedLine(elapsed, line[0], line[1:])
+
+
+@attr.define
+class ReplayStats:
+    """Outcome of a replay."""
+
+    lines: int = 0
+    duration: float = 0.0
+    elapsed: float = 0.0
+    max_lag: float = 0.0
+
+
+async def async_replay(
+    path: str,
+    target: LyngdorfApi | LyngdorfDevice,
+    speed: float | None = 1.0,
+) -> ReplayStats:
+    """
+    Feed the received lines of a capture into an API or device.
+
+    Lines are delivered at their captured times divided by speed, or as fast
+    as possible without a speed. Sent lines are skipped, the echoes of the
+    device are part of the received lines. Returns once every line has been
+    dispatched to the callbacks.
+    """
+    if speed is not None and speed <= 0:
+        raise ValueError("speed must be positive")
+    if isinstance(target, LyngdorfDevice):
+        target._register_callbacks()
+        api = target._api
+    else:
+        api = target
+
+    loop = asyncio.get_running_loop()
+    stats = ReplayStats()
+    started = loop.time()
+    for captured in read_capture(path):
+        stats.duration = captured.time
+        if captured.direction != TRAFFIC_RECEIVED:
+            continue
+        if speed is not None:
+            due = started + captured.time / speed
+            lag = loop.time() - due
+            if lag < 0:
+                await asyncio.sleep(-lag)
+            elif lag > stats.max_lag:
+                stats.max_lag = lag
+        api._process_message(captured.line)
+        stats.lines += 1
+
+    await api._dispatcher.async_join()
+    # Let notifications queued by the last callbacks go out
+    await asyncio.sleep(0)
+    stats.elapsed = loop.time() - started
+    return stats
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Replay a capture into a device and print the outcome."""
+    model = DeviceModel(args.model) if args.model else None
+    device = Lyngdorf.create("replay", device_model=model)
+    device._music_player = None
+    stats = await async_replay(args.path, device, args.speed)
+    print(
+        f"Replayed {stats.lines} lines of {stats.duration:.3f}s "
+        f"in {stats.elapsed:.3f}s, max lag {stats.max_lag * 1000:.1f} ms"
+    )
+    print(f"Dispatch: {device._api.dispatch_stats}")
+    print(f"Notifications: {device.notification_stats}")
+
+
+def main() -> None:
+    """Replay a capture from the command line."""
+    parser = argparse.ArgumentParser(description="Replay a Lyngdorf capture.")
+    parser.add_argument("path")
+    parser.add_argument("--model", default=None, help="device model, e.g. MP-60")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=None,
+        help="replay speed, e.g. 1 for real time (default: as fast as possible)",
+    )
+    asyncio.run(_async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
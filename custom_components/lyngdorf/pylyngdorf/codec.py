@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Module implements the JSON codecs of the music player.
+
+:license: MIT, see LICENSE for more details.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+import attr
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
+
+@attr.define(frozen=True)
+class JsonCodec:
+    """Decode response bodies and encode request values."""
+
+    name: str
+    loads: Callable[[bytes], Any]
+    dumps: Callable[[Any], str]
+
+
+STDLIB_CODEC = JsonCodec("json", json.loads, json.dumps)
+
+ORJSON_CODEC: JsonCodec | None = (
+    JsonCodec("orjson", orjson.loads, lambda value: orjson.dumps(value).decode())
+    if orjson is not None
+    else None
+)
+
+DEFAULT_CODEC = ORJSON_CODEC or STDLIB_CODEC
@@ -21,6 +21,18 @@ LYNGDORF_ATTR_SETATTR: list[Callable[..., object]] = [
 # Defaults
 DEFAULT_PORT = 84
 
+PIPELINE_WINDOW = 1
+LATE_ECHO_WINDOW = 10.0
+BOOTSTRAP_TIMEOUT = 5.0
+PLAYER_BOOTSTRAP_TIMEOUT = 10.0
+PLAYER_REQUEST_TIMEOUT = 10.0
+PLAYER_CONNECTIONS_PER_HOST = 6
+PLAYER_KEEPALIVE_TIMEOUT = 60.0
+POSITION_DRIFT = 2.0
+RAMP_INTERVAL = 0.05
+DEBOUNCE_DELAY = 0.15
+PROBE_TIMEOUT = 2.0
+PROBE_CONCURRENCY = 4
 MONITOR_INTERVAL = 90.0
 RECONNECT_BACKOFF = 0.5
 RECONNECT_SCALE = 2.0
@@ -29,6 +41,13 @@ RECONNECT_MAX_WAIT = 30.0
 COMMAND_PREFIX = "!"
 ECHO_PREFIX = "#"
 MIN_MESSAGE_LENGTH = 3
+MAX_LINE_LENGTH = 1024
+EVENT_QUEUE_LIMIT = 1000
+# Above the lines of a complete state dump
+MIN_EVENT_QUEUE_LIMIT = 256
+RESYNC_ATTEMPTS = 3
+TRAFFIC_RECEIVED = "<"
+TRAFFIC_SENT = ">"
 
 MIN_VOLUME_DB = -99.9
 DEFAULT_MAX_VOLUME_DB = 12.0
@@ -124,6 +143,24 @@ class LyngdorfCommand(Enum):
     BACK = auto()
 
 
+class LyngdorfSetting(str, Enum):
+    """Settable fields of Lyngdorf devices, in the order they are applied."""
+
+    SOURCE = "source"
+    AUDIO_MODE = "audio_mode"
+    VOICING = "voicing"
+    FOCUS_POSITION = "focus_position"
+    LIPSYNC = "lipsync"
+    BASS_TRIM = "bass_trim"
+    TREBLE_TRIM = "treble_trim"
+    CENTER_TRIM = "center_trim"
+    HEIGHTS_TRIM = "heights_trim"
+    LFE_TRIM = "lfe_trim"
+    SURROUNDS_TRIM = "surrounds_trim"
+    MUTE = "mute"
+    VOLUME = "volume"
+
+
 class LyngdorfQuery(Enum):
     """Lyngdorf queries."""
 
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Module implements debounced setters for Lyngdorf devices.
+
+:license: MIT, see LICENSE for more details.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import attr
+
+from .const import DEBOUNCE_DELAY, LYNGDORF_ATTR_SETATTR, LyngdorfCommand
+from .exceptions import LyngdorfError, LyngdorfProcessingError
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@attr.define(slots=True)
+class DebounceStats:
+    """Counters of the debounced setters."""
+
+    submitted: int = 0
+    sent: int = 0
+    coalesced: int = 0
+
+
+@attr.define(slots=True)
+class _DebouncedField:
+    """The pending value of a command and the callers waiting for it."""
+
+    value: Any = None
+    pending: bool = False
+    waiters: list[asyncio.Future[None]] = attr.field(factory=list)
+    handle: asyncio.TimerHandle | None = None
+    task: asyncio.Task[None] | None = None
+
+
+@attr.define(on_setattr=LYNGDORF_ATTR_SETATTR)
+class CommandDebouncer:
+    """
+    Send the latest value of each command, coalescing bursts.
+
+    A value for an idle command is sent at once. While a value of the same
+    command is in flight, newer values replace the pending one, which is sent
+    once no value has been submitted for delay seconds and the previous value
+    is confirmed. Callers of replaced values resolve with the confirmation of
+    the value sent in their place.
+    """
+
+    send: Callable[[LyngdorfCommand, Any], Awaitable[None]] = attr.field()
+    delay: float = attr.field(
+        converter=float, default=DEBOUNCE_DELAY, validator=attr.validators.ge(0)
+    )
+    _fields: dict[LyngdorfCommand, _DebouncedField] = attr.field(
+        factory=dict, init=False
+    )
+    _stats: DebounceStats = attr.field(factory=DebounceStats, init=False)
+
+    @property
+    def stats(self) -> DebounceStats:
+        """Return the counters of the debouncer."""
+        return self._stats
+
+    async def async_send(self, command: LyngdorfCommand, arg: Any) -> None:
+        """Send the value of a command, coalesced with the values that follow."""
+        loop = asyncio.get_running_loop()
+        field = self._fields.get(command)
+        if field is None:
+            field = self._fields[command] = _DebouncedField()
+
+        self._stats.submitted += 1
+        if field.pending:
+            self._stats.coalesced += 1
+        field.value = arg
+        field.pending = True
+        waiter = loop.create_future()
+        field.waiters.append(waiter)
+
+        if field.task is None and field.handle is None:
+            self._flush(command)
+        else:
+            if field.handle is not None:
+                field.handle.cancel()
+            field.handle = loop.call_later(self.delay, self._flush, command)
+        await waiter
+
+    def cancel(self) -> None:
+        """Drop the pending values, failing the callers waiting for them."""
+        fields, self._fields = self._fields, {}
+        for field in fields.values():
+            if field.handle is not None:
+                field.handle.cancel()
+            if field.task is not None:
+                field.task.cancel()
+            _resolve(field.waiters, LyngdorfProcessingError("Setter cancelled"))
+
+    def _flush(self, command: LyngdorfCommand) -> None:
+        """Send the pending value unless one is still in flight."""
+        field = self._fields[command]
+        field.handle = None
+        if field.task is not None or not field.pending:
+            return
+
+        waiters, field.waiters = field.waiters, []
+        field.pending = False
+        self._stats.sent += 1
+        field.task = asyncio.get_running_loop().create_task(
+            self._async_send(command, field, field.value, waiters)
+        )
+
+    async def _async_send(
+        self,
+        command: LyngdorfCommand,
+        field: _DebouncedField,
+        value: Any,
+        waiters: list[asyncio.Future[None]],
+    ) -> None:
+        """Send a value and resolve its callers with the outcome."""
+        try:
+            await self.send(command, value)
+        except asyncio.CancelledError:
+            _resolve(waiters, LyngdorfProcessingError("Setter cancelled"))
+            raise
+        except (LyngdorfError, OSError, ValueError) as err:
+            _LOGGER.debug("Sending %s(%s) failed: %s", command.name, value, err)
+            _resolve(waiters, err)
+        else:
+            _resolve(waiters)
+        finally:
+            field.task = None
+
+        if field.pending and field.handle is None:
+            self._flush(command)
+
+
+def _resolve(
+    waiters: list[asyncio.Future[None]], err: BaseException | None = None
+) -> None:
+    """Resolve waiting callers, with an error if given."""
+    for waiter in waiters:
+        if waiter.done():
+            continue
+        if err is None:
+            waiter.set_result(None)
+        else:
+            waiter.set_exception(err)
@@ -5,12 +5,17 @@ Module implements the device class for Lyngdorf devices.
 :license: MIT, see LICENSE for more details.
 """
 
+import asyncio
+import collections
+import contextlib
 import inspect
 import logging
-from collections.abc import Awaitable, Callable, Coroutine
+import operator
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
 from functools import wraps
 from typing import Any
 
+import aiohttp
 import attr
 
 from .api import LyngdorfApi
@@ -20,18 +25,25 @@ from .const import (
     DEFAULT_MAX_VOLUME_DB,
     DEFAULT_MIN_LIPSYNC,
     LYNGDORF_ATTR_SETATTR,
+    PIPELINE_WINDOW,
     DeviceModel,
     LyngdorfQuery,
 )
+from .debounce import CommandDebouncer
 from .music_player import MediaData, MusicPlayer
+from .parser import (
+    Decoder,
+    decode_bool,
+    decode_indexed,
+    decode_int,
+    decode_tenths,
+)
+from .ramp import VolumeRamp
+from .registry import ConnectionHandle
 from .utils import (
     FixedSizeDict,
-    compute_alpha,
+    VolumeCurve,
     convert_on_off_bool,
-    convert_volume,
-    db_to_linear_flattened,
-    linear_to_db_flattened,
-    lookup_description,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -85,33 +97,80 @@ _CALLBACK_MAP: dict[str, str] = {
     # Loudness / Tone controls
     "LOUDNESS": "_async_loudness_callback",
     "TRIMBASS": "_async_bass_trim_callback",
-    "TRIMTREBLE": "_async_treble_trim_callback",
+    "TRIMTREB": "_async_treble_trim_callback",
     "TRIMCENTER": "_async_center_trim_callback",
     "TRIMHEIGHT": "_async_heights_trim_callback",
     "TRIMLFE": "_async_lfe_trim_callback",
     "TRIMSURRS": "_async_surrounds_trim_callback",
 }
 
+# Parameter decoders by callback, applied before the callback runs
+_DECODER_MAP: dict[str, Decoder] = {
+    "_async_power_callback": decode_bool,
+    "_async_volume_callback": decode_tenths,
+    "_async_mute_callback": decode_bool,
+    "_async_max_volume_callback": decode_tenths,
+    "_async_source_count_callback": decode_int,
+    "_async_source_callback": decode_indexed,
+    "_async_stream_type_callback": decode_int,
+    "_async_voicing_count_callback": decode_int,
+    "_async_voicing_callback": decode_indexed,
+    "_async_focus_position_count_callback": decode_int,
+    "_async_focus_position_callback": decode_indexed,
+    "_async_audio_mode_count_callback": decode_int,
+    "_async_audio_mode_callback": decode_indexed,
+    "_async_audio_input_callback": decode_int,
+    "_async_video_input_callback": decode_int,
+    "_async_video_output_callback": decode_int,
+    "_async_lipsync_range_callback": decode_int,
+    "_async_lipsync_callback": decode_int,
+    "_async_dts_dialog_available_callback": decode_bool,
+    "_async_dts_dialog_callback": decode_tenths,
+    "_async_loudness_callback": decode_bool,
+    "_async_bass_trim_callback": decode_tenths,
+    "_async_treble_trim_callback": decode_tenths,
+    "_async_center_trim_callback": decode_tenths,
+    "_async_heights_trim_callback": decode_tenths,
+    "_async_lfe_trim_callback": decode_tenths,
+    "_async_surrounds_trim_callback": decode_tenths,
+}
+
+_EVENT_DECODERS: dict[str, Decoder] = {
+    event: _DECODER_MAP[callback_name]
+    for event, callback_name in _CALLBACK_MAP.items()
+    if callback_name in _DECODER_MAP
+}
+
 
-def notify_callback(
-    event: LyngdorfQuery,
-    attr_getter: Callable[["LyngdorfDevice"], Any] | None = None,
-):
-    """Run notification callback, optionally when value has changed."""
+@attr.define(slots=True)
+class NotificationStats:
+    """Counters of delivered and suppressed notifications."""
+
+    delivered: int = 0
+    suppressed: int = 0
+    suppressed_events: collections.Counter[LyngdorfQuery] = attr.field(
+        factory=collections.Counter
+    )
+
+
+def notify_callback(event: LyngdorfQuery, *fields: str):
+    """Run notification callback when the value of a field has changed."""
+    field_getter = operator.attrgetter(*fields)
 
     def decorator(
         func: Callable[..., Coroutine[Any, Any, Any]],
     ) -> Callable[..., Coroutine[Any, Any, None]]:
         @wraps(func)
         async def wrapper(self: "LyngdorfDevice", *args: Any, **kwargs: Any) -> Any:
-            old_value = attr_getter(self) if attr_getter else None
+            old_value = field_getter(self)
             result = await func(self, *args, **kwargs)
-            if attr_getter:
-                new_value = attr_getter(self)
-                if old_value != new_value:
-                    await self.run_notify_callback(event)
-            else:
+            stats = self._notification_stats
+            if field_getter(self) != old_value:
+                stats.delivered += 1
                 await self.run_notify_callback(event)
+            else:
+                stats.suppressed += 1
+                stats.suppressed_events[event] += 1
             return result
 
         return wrapper
@@ -119,7 +178,7 @@ def notify_callback(
     return decorator
 
 
-NotificationCallbackType = Callable[[LyngdorfQuery], None | Awaitable[None]]
+NotificationCallbackType = Callable[[frozenset[LyngdorfQuery]], None | Awaitable[None]]
 
 
 @attr.define(kw_only=True, on_setattr=LYNGDORF_ATTR_SETATTR)
@@ -129,32 +188,34 @@ class LyngdorfDevice:
     host: str = attr.field()
     port: int = attr.field(converter=int)
     timeout: float = attr.field(converter=float)
+    pipeline_window: int = attr.field(converter=int, default=PIPELINE_WINDOW)
     device_model: DeviceModel | None = attr.field()
+    session: aiohttp.ClientSession | None = attr.field(default=None)
 
     _api: LyngdorfApi = attr.field(
         factory=lambda: LyngdorfApi(device_protocol=DEFAULT_PROTOCOL),
         validator=attr.validators.instance_of(LyngdorfApi),
     )
+    _connection: ConnectionHandle | None = attr.field(default=None)
+    _own_api: LyngdorfApi = attr.field(init=False)
     _notification_callback: NotificationCallbackType | None = attr.field(default=None)
+    _pending_notifications: set[LyngdorfQuery] = attr.field(factory=set)
+    _notification_handle: asyncio.Handle | None = attr.field(default=None)
+    _notification_tasks: set[asyncio.Task[Any]] = attr.field(factory=set)
+    _transaction_depth: int = attr.field(default=0)
+    _notification_stats: NotificationStats = attr.field(factory=NotificationStats)
     _music_player: MusicPlayer | None = attr.field(default=None)
     # Common properties
     _model: DeviceModel | None = attr.field(default=None)
     _multichannel: bool = attr.field(default=False)
-    _power: bool | None = attr.field(
-        converter=attr.converters.optional(convert_on_off_bool), default=None
-    )
-    _volume: float | None = attr.field(
-        converter=attr.converters.optional(convert_volume), default=None
-    )
+    _power: bool | None = attr.field(default=None)
+    _volume: float | None = attr.field(default=None)
     _volume_level: float | None = attr.field(default=None)
-    _muted: bool = attr.field(
-        converter=attr.converters.optional(convert_on_off_bool), default=True
-    )
-    _max_volume: float = attr.field(
-        converter=attr.converters.optional(convert_volume),
-        default=DEFAULT_MAX_VOLUME_DB * 10,
-    )
-    _alpha: float = attr.field(default=1.0)
+    _muted: bool | None = attr.field(default=True)
+    _max_volume: float = attr.field(default=DEFAULT_MAX_VOLUME_DB)
+    _volume_curve: VolumeCurve = attr.field(init=False)
+    _volume_ramp: VolumeRamp = attr.field(init=False)
+    _debouncer: CommandDebouncer = attr.field(init=False)
 
     # Sources properties
     _sources: FixedSizeDict = attr.field(factory=FixedSizeDict)
@@ -175,36 +236,18 @@ class LyngdorfDevice:
     _video_input: str | None = attr.field(default=None)
     _video_type: str | None = attr.field(default=None)
     _video_output: str | None = attr.field(default=None)
-    _lipsync: int = attr.field(converter=attr.converters.optional(int), default=None)
-    _min_lipsync: int = attr.field(converter=int, default=DEFAULT_MIN_LIPSYNC)
-    _max_lipsync: int = attr.field(converter=int, default=DEFAULT_MAX_LIPSYNC)
-    _dts_dialog_available: bool | None = attr.field(
-        converter=attr.converters.optional(convert_on_off_bool), default=None
-    )
-    _dts_dialog: float | None = attr.field(
-        converter=attr.converters.optional(convert_volume), default=None
-    )
-    _loudness: bool | None = attr.field(
-        converter=attr.converters.optional(convert_on_off_bool), default=None
-    )
-    _bass_trim: float | None = attr.field(
-        converter=attr.converters.optional(convert_volume), default=None
-    )
-    _treble_trim: float | None = attr.field(
-        converter=attr.converters.optional(convert_volume), default=None
-    )
-    _center_trim: float | None = attr.field(
-        converter=attr.converters.optional(convert_volume), default=None
-    )
-    _heights_trim: float | None = attr.field(
-        converter=attr.converters.optional(convert_volume), default=None
-    )
-    _lfe_trim: float | None = attr.field(
-        converter=attr.converters.optional(convert_volume), default=None
-    )
-    _surrounds_trim: float | None = attr.field(
-        converter=attr.converters.optional(convert_volume), default=None
-    )
+    _lipsync: int | None = attr.field(default=None)
+    _min_lipsync: int = attr.field(default=DEFAULT_MIN_LIPSYNC)
+    _max_lipsync: int = attr.field(default=DEFAULT_MAX_LIPSYNC)
+    _dts_dialog_available: bool | None = attr.field(default=None)
+    _dts_dialog: float | None = attr.field(default=None)
+    _loudness: bool | None = attr.field(default=None)
+    _bass_trim: float | None = attr.field(default=None)
+    _treble_trim: float | None = attr.field(default=None)
+    _center_trim: float | None = attr.field(default=None)
+    _heights_trim: float | None = attr.field(default=None)
+    _lfe_trim: float | None = attr.field(default=None)
+    _surrounds_trim: float | None = attr.field(default=None)
     _media_data: MediaData = attr.field(default=MediaData())
 
     def __attrs_post_init__(self) -> None:
@@ -212,12 +255,16 @@ class LyngdorfDevice:
         self._api.host = self.host
         self._api.port = self.port
         self._api.timeout = self.timeout
-        self._music_player = MusicPlayer(self.host, self._async_media_data_callback)
+        self._api.pipeline_window = self.pipeline_window
+        self._own_api = self._api
+        self._music_player = MusicPlayer(
+            self.host, self._async_media_data_callback, session=self.session
+        )
 
         if self.device_model is not None and self.device_model in DEVICE_PROTOCOLS:
             self._api.device_protocol = DEVICE_PROTOCOLS[self.device_model]
 
-        self._alpha = compute_alpha(self._max_volume)
+        self._volume_curve = VolumeCurve(self._max_volume)
 
     async def _async_handle_poller(self, start: bool) -> None:
         """Start or stop the music player poller."""
@@ -229,24 +276,60 @@ class LyngdorfDevice:
         _LOGGER.debug("Register event callbacks")
         for event, callback_name in _CALLBACK_MAP.items():
             callback_fn = getattr(self, callback_name)
-            self._api.register_callback(event, callback_fn)
+            self._api.register_callback(event, callback_fn, _EVENT_DECODERS.get(event))
+
+    def _unregister_callbacks(self) -> None:
+        """Unregister the event callbacks of the device."""
+        for event, callback_name in _CALLBACK_MAP.items():
+            with contextlib.suppress(ValueError):
+                self._api.unregister_callback(event, getattr(self, callback_name))
 
     def set_notification_callback(self, callback: NotificationCallbackType):
         self._notification_callback = callback
 
     async def run_notify_callback(self, event: LyngdorfQuery):
-        if self._notification_callback:
-            if inspect.iscoroutinefunction(self._notification_callback):
-                await self._notification_callback(event)
-            else:
-                self._notification_callback(event)
+        """Queue a notification, delivered with the others of this loop tick."""
+        self._pending_notifications.add(event)
+        if self._transaction_depth or self._notification_handle is not None:
+            return
+        self._notification_handle = asyncio.get_running_loop().call_soon(
+            self._flush_notifications
+        )
+
+    @contextlib.asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Hold notifications until the block exits, then deliver them at once."""
+        self._transaction_depth += 1
+        try:
+            yield
+        finally:
+            self._transaction_depth -= 1
+            if not self._transaction_depth:
+                self._flush_notifications()
+
+    def _flush_notifications(self) -> None:
+        """Deliver the pending notifications as one batch."""
+        self._notification_handle = None
+        if self._transaction_depth or not self._pending_notifications:
+            return
+
+        events = frozenset(self._pending_notifications)
+        self._pending_notifications.clear()
+        if not self._notification_callback:
+            return
+        if inspect.iscoroutinefunction(self._notification_callback):
+            task = asyncio.create_task(self._notification_callback(events))
+            self._notification_tasks.add(task)
+            task.add_done_callback(self._notification_tasks.discard)
+        else:
+            self._notification_callback(events)
 
     async def wait_while_connected(self) -> None:
         """Block while the connection is enabled."""
         await self._api.wait_while_connected()
 
-    @notify_callback(LyngdorfQuery.DEVICE)
-    async def _async_model_callback(self, event: str, params: list[str]) -> None:
+    @notify_callback(LyngdorfQuery.DEVICE, "_model")
+    async def _async_model_callback(self, event: str, params: list[Any]) -> None:
         """Handle a device model event."""
         self._model = (
             DeviceModel(params[0])
@@ -257,14 +340,14 @@ class LyngdorfDevice:
         if self._model and self._api.device_protocol is DEFAULT_PROTOCOL:
             self._api.device_protocol = DEVICE_PROTOCOLS[self._model]
 
-    @notify_callback(LyngdorfQuery.POWER)
-    async def _async_power_callback(self, event: str, params: list[str]) -> None:
+    @notify_callback(LyngdorfQuery.POWER, "_power")
+    async def _async_power_callback(self, event: str, params: list[Any]) -> None:
         """Handle a power change event."""
         self._power = params[0] if params else None
         await self._async_handle_poller(bool(self._power))
 
-    @notify_callback(LyngdorfQuery.VOLUME)
-    async def _async_volume_callback(self, event: str, params: list[str]) -> None:
+    @notify_callback(LyngdorfQuery.VOLUME, "_volume")
+    async def _async_volume_callback(self, event: str, params: list[Any]) -> None:
         """Handle a volume change event."""
         self._volume = params[0] if params else None
         volume = self._volume
@@ -272,31 +355,34 @@ class LyngdorfDevice:
             self._db_to_linear_flattened(volume) if volume is not None else None
         )
 
-    @notify_callback(LyngdorfQuery.MUTE)
-    async def _async_mute_callback(self, event: str, params: list[str]) -> None:
+    @notify_callback(LyngdorfQuery.MUTE, "_muted")
+    async def _async_mute_callback(self, event: str, params: list[Any]) -> None:
         """Handle a muting change event."""
-        self._muted = params[0] if params else event[4:]
+        self._muted = params[0] if params else convert_on_off_bool(event[4:])
 
-    @notify_callback(LyngdorfQuery.MAX_VOLUME)
-    async def _async_max_volume_callback(self, event: str, params: list[str]) -> None:
+    @notify_callback(LyngdorfQuery.MAX_VOLUME, "_max_volume", "_volume_level")
+    async def _async_max_volume_callback(self, event: str, params: list[Any]) -> None:
         """Handle a max volume event."""
-        self._volume = params[0] if params else None
-        volume = self._volume
+        if not params or params[0] == self._max_volume:
+            return
 
+        self._max_volume = params[0]
+        self._volume_curve = VolumeCurve(self._max_volume)
+        volume = self._volume
         self._volume_level = (
             self._db_to_linear_flattened(volume) if volume is not None else None
         )
 
-    async def _async_source_count_callback(self, event: str, params: list[str]) -> None:
+    async def _async_source_count_callback(self, event: str, params: list[Any]) -> None:
         """Handle a source count event."""
         if params:
-            self._sources.set_size(int(params[0]))
+            self._sources.set_size(params[0])
 
-    @notify_callback(LyngdorfQuery.SOURCE, lambda self: self._source)
-    async def _async_source_callback(self, event: str, params: list[str]) -> None:
+    @notify_callback(LyngdorfQuery.SOURCE, "_source")
+    async def _async_source_callback(self, event: str, params: list[Any]) -> None:
         """Handle a source event."""
         if params:
-            source_id = int(params[0])
+            source_id = params[0]
             if self._sources.is_full():
                 self._source = self._sources.get_by_id(source_id)
             else:
@@ -304,27 +390,25 @@ class LyngdorfDevice:
                 if self._sources.is_full():
                     await self.run_notify_callback(LyngdorfQuery.SOURCE_LIST)
 
-    @notify_callback(LyngdorfQuery.STREAM_TYPE, lambda self: self._stream_type)
-    async def _async_stream_type_callback(self, event: str, params: list[str]) -> None:
+    @notify_callback(LyngdorfQuery.STREAM_TYPE, "_stream_type")
+    async def _async_stream_type_callback(self, event: str, params: list[Any]) -> None:
         """Handle a stream type change event."""
         self._stream_type = (
-            lookup_description(params[0], self._api.device_protocol.stream_types)
-            if params
-            else None
+            self._api.device_protocol.stream_types.get(params[0]) if params else None
         )
 
     async def _async_voicing_count_callback(
-        self, event: str, params: list[str]
+        self, event: str, params: list[Any]
     ) -> None:
         """Handle a voicing count event."""
         if params:
-            self._voicings.set_size(int(params[0]))
+            self._voicings.set_size(params[0])
 
-    @notify_callback(LyngdorfQuery.VOICING, lambda self: self._voicing)
-    async def _async_voicing_callback(self, event: str, params: list[str]) -> None:
+    @notify_callback(LyngdorfQuery.VOICING, "_voicing")
+    async def _async_voicing_callback(self, event: str, params: list[Any]) -> None:
         """Handle a voicing event."""
         if params:
-            voicing_id = int(params[0])
+            voicing_id = params[0]
             if self._voicings.is_full():
                 self._voicing = self._voicings.get_by_id(voicing_id)
             else:
@@ -333,19 +417,19 @@ class LyngdorfDevice:
                     await self.run_notify_callback(LyngdorfQuery.VOICING_LIST)
 
     async def _async_focus_position_count_callback(
-        self, event: str, params: list[str]
+        self, event: str, params: list[Any]
     ) -> None:
         """Handle a focus position count event."""
         if params:
-            self._focus_positions.set_size(int(params[0]))
+            self._focus_positions.set_size(params[0])
 
-    @notify_callback(LyngdorfQuery.FOCUS_POSITION, lambda self: self._focus_position)
+    @notify_callback(LyngdorfQuery.FOCUS_POSITION, "_focus_position")
     async def _async_focus_position_callback(
-        self, event: str, params: list[str]
+        self, event: str, params: list[Any]
     ) -> None:
         """Handle a focus position event."""
         if params:
-            focus_position_id = int(params[0])
+            focus_position_id = params[0]
             if self._focus_positions.is_full():
                 self._focus_position = self._focus_positions.get_by_id(
                     focus_position_id
@@ -356,17 +440,17 @@ class LyngdorfDevice:
                     await self.run_notify_callback(LyngdorfQuery.FOCUS_POSITION_LIST)
 
     async def _async_audio_mode_count_callback(
-        self, event: str, params: list[str]
+        self, event: str, params: list[Any]
     ) -> None:
         """Handle a audio mode count event."""
         if params:
-            self._audio_modes.set_size(int(params[0]))
+            self._audio_modes.set_size(params[0])
 
-    @notify_callback(LyngdorfQuery.AUDIO_MODE, lambda self: self._audio_mode)
-    async def _async_audio_mode_callback(self, event: str, params: list[str]) -> None:
+    @notify_callback(LyngdorfQuery.AUDIO_MODE, "_audio_mode")
+    async def _async_audio_mode_callback(self, event: str, params: list[Any]) -> None:
         """Handle a audio mode event."""
         if params:
-            audio_mode_id = int(params[0])
+            audio_mode_id = params[0]
             if self._audio_modes.is_full():
                 self._audio_mode = self._audio_modes.get_by_id(audio_mode_id)
             else:
@@ -374,115 +458,109 @@ class LyngdorfDevice:
                 if self._audio_modes.is_full():
                     await self.run_notify_callback(LyngdorfQuery.AUDIO_MODE_LIST)
 
-    @notify_callback(LyngdorfQuery.AUDIO_INPUT, lambda self: self._audio_input)
-    async def _async_audio_input_callback(self, event: str, params: list[str]) -> None:
+    @notify_callback(LyngdorfQuery.AUDIO_INPUT, "_audio_input")
+    async def _async_audio_input_callback(self, event: str, params: list[Any]) -> None:
         """Handle a audio input change event."""
         self._audio_input = (
-            lookup_description(params[0], self._api.device_protocol.audio_inputs)
-            if params
-            else None
+            self._api.device_protocol.audio_inputs.get(params[0]) if params else None
         )
 
-    @notify_callback(LyngdorfQuery.AUDIO_TYPE, lambda self: self._audio_type)
-    async def _async_audio_type_callback(self, event: str, params: list[str]) -> None:
+    @notify_callback(LyngdorfQuery.AUDIO_TYPE, "_audio_type")
+    async def _async_audio_type_callback(self, event: str, params: list[Any]) -> None:
         """Handle a audio type change event."""
         self._audio_type = ", ".join(params) if params else None
 
-    @notify_callback(LyngdorfQuery.VIDEO_INPUT, lambda self: self._video_input)
-    async def _async_video_input_callback(self, event: str, params: list[str]) -> None:
+    @notify_callback(LyngdorfQuery.VIDEO_INPUT, "_video_input")
+    async def _async_video_input_callback(self, event: str, params: list[Any]) -> None:
         """Handle a video input event."""
         self._video_input = (
-            lookup_description(params[0], self._api.device_protocol.video_inputs)
-            if params
-            else None
+            self._api.device_protocol.video_inputs.get(params[0]) if params else None
         )
 
-    @notify_callback(LyngdorfQuery.VIDEO_TYPE, lambda self: self._video_type)
-    async def _async_video_type_callback(self, event: str, params: list[str]) -> None:
+    @notify_callback(LyngdorfQuery.VIDEO_TYPE, "_video_type")
+    async def _async_video_type_callback(self, event: str, params: list[Any]) -> None:
         """Handle a video type change event."""
         self._video_type = params[0] if params else None
 
-    @notify_callback(LyngdorfQuery.VIDEO_OUTPUT, lambda self: self._video_output)
-    async def _async_video_output_callback(self, event: str, params: list[str]) -> None:
+    @notify_callback(LyngdorfQuery.VIDEO_OUTPUT, "_video_output")
+    async def _async_video_output_callback(self, event: str, params: list[Any]) -> None:
         """Handle a video output event."""
         self._video_output = (
-            lookup_description(params[0], self._api.device_protocol.video_outputs)
-            if params
-            else None
+            self._api.device_protocol.video_outputs.get(params[0]) if params else None
         )
 
-    @notify_callback(LyngdorfQuery.LIPSYNC_RANGE)
+    @notify_callback(LyngdorfQuery.LIPSYNC_RANGE, "_min_lipsync", "_max_lipsync")
     async def _async_lipsync_range_callback(
-        self, event: str, params: list[str]
+        self, event: str, params: list[Any]
     ) -> None:
         """Handle a lipsync range event."""
         if len(params) == 2:
             self._min_lipsync = params[0]
             self._max_lipsync = params[1]
 
-    @notify_callback(LyngdorfQuery.LIPSYNC)
-    async def _async_lipsync_callback(self, event: str, params: list[str]) -> None:
+    @notify_callback(LyngdorfQuery.LIPSYNC, "_lipsync")
+    async def _async_lipsync_callback(self, event: str, params: list[Any]) -> None:
         """Handle a lipsync event."""
         self._lipsync = params[0] if params else None
 
-    @notify_callback(LyngdorfQuery.DTS_DIALOG_AVAILABLE)
+    @notify_callback(LyngdorfQuery.DTS_DIALOG_AVAILABLE, "_dts_dialog_available")
     async def _async_dts_dialog_available_callback(
-        self, event: str, params: list[str]
+        self, event: str, params: list[Any]
     ) -> None:
         """Handle a dts dialog available event."""
         self._dts_dialog_available = params[0] if params else None
 
-    @notify_callback(LyngdorfQuery.DTS_DIALOG)
-    async def _async_dts_dialog_callback(self, event: str, params: list[str]) -> None:
+    @notify_callback(LyngdorfQuery.DTS_DIALOG, "_dts_dialog")
+    async def _async_dts_dialog_callback(self, event: str, params: list[Any]) -> None:
         """Handle a dts dialog event."""
         self._dts_dialog = params[0] if params else None
 
-    @notify_callback(LyngdorfQuery.LOUDNESS)
-    async def _async_loudness_callback(self, event: str, params: list[str]) -> None:
+    @notify_callback(LyngdorfQuery.LOUDNESS, "_loudness")
+    async def _async_loudness_callback(self, event: str, params: list[Any]) -> None:
         """Handle a loudness event."""
         self._loudness = params[0] if params else None
 
-    @notify_callback(LyngdorfQuery.BASS_TRIM)
-    async def _async_bass_trim_callback(self, event: str, params: list[str]) -> None:
+    @notify_callback(LyngdorfQuery.BASS_TRIM, "_bass_trim")
+    async def _async_bass_trim_callback(self, event: str, params: list[Any]) -> None:
         """Handle a bass trim event."""
         self._bass_trim = params[0] if params else None
 
-    @notify_callback(LyngdorfQuery.TREBLE_TRIM)
-    async def _async_treble_trim_callback(self, event: str, params: list[str]) -> None:
+    @notify_callback(LyngdorfQuery.TREBLE_TRIM, "_treble_trim")
+    async def _async_treble_trim_callback(self, event: str, params: list[Any]) -> None:
         """Handle a treble trim event."""
         self._treble_trim = params[0] if params else None
 
-    @notify_callback(LyngdorfQuery.CENTER_TRIM)
-    async def _async_center_trim_callback(self, event: str, params: list[str]) -> None:
+    @notify_callback(LyngdorfQuery.CENTER_TRIM, "_center_trim")
+    async def _async_center_trim_callback(self, event: str, params: list[Any]) -> None:
         """Handle a center trim event."""
         self._center_trim = params[0] if params else None
 
-    @notify_callback(LyngdorfQuery.HEIGHTS_TRIM)
-    async def _async_heights_trim_callback(self, event: str, params: list[str]) -> None:
+    @notify_callback(LyngdorfQuery.HEIGHTS_TRIM, "_heights_trim")
+    async def _async_heights_trim_callback(self, event: str, params: list[Any]) -> None:
         """Handle a height trim event."""
         self._heights_trim = params[0] if params else None
 
-    @notify_callback(LyngdorfQuery.LFE_TRIM)
-    async def _async_lfe_trim_callback(self, event: str, params: list[str]) -> None:
+    @notify_callback(LyngdorfQuery.LFE_TRIM, "_lfe_trim")
+    async def _async_lfe_trim_callback(self, event: str, params: list[Any]) -> None:
         """Handle a lfe trim event."""
         self._lfe_trim = params[0] if params else None
 
-    @notify_callback(LyngdorfQuery.SURROUNDS_TRIM)
+    @notify_callback(LyngdorfQuery.SURROUNDS_TRIM, "_surrounds_trim")
     async def _async_surrounds_trim_callback(
-        self, event: str, params: list[str]
+        self, event: str, params: list[Any]
     ) -> None:
         """Handle a surround trim event."""
         self._surrounds_trim = params[0] if params else None
 
-    @notify_callback(LyngdorfQuery.MEDIA_DATA)
+    @notify_callback(LyngdorfQuery.MEDIA_DATA, "_media_data")
     async def _async_media_data_callback(self, media_data: MediaData) -> None:
         """Handle a media data event"""
         self._media_data = media_data
 
     def _linear_to_db_flattened(self, value: float) -> float:
         """Convert a linear float [0-1] to dB (0.5 decimal)."""
-        return linear_to_db_flattened(value, self._max_volume, self._alpha)
+        return self._volume_curve.linear_to_db(value)
 
     def _db_to_linear_flattened(self, db: float) -> float:
         """Convert dB value to a float linear value [0-1] (rounded to 3 decimals)."""
-        return db_to_linear_flattened(db, self._max_volume, self._alpha)
+        return self._volume_curve.db_to_linear(db)
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Module implements the ordered event dispatcher for Lyngdorf devices.
+
+:license: MIT, see LICENSE for more details.
+"""
+
+import asyncio
+import collections
+import contextlib
+import logging
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any, Final
+
+import attr
+
+from .const import COMMAND_PREFIX, EVENT_QUEUE_LIMIT
+from .parser import LyngdorfParsedMessage
+
+_LOGGER = logging.getLogger(__name__)
+
+# Status events carrying a complete state, a newer one makes a pending one
+# obsolete. Enumerations like SRC or RPVOI must all be delivered.
+SUPERSEDING_EVENTS: Final[Mapping[str, str]] = {
+    "POWER": "POWER",
+    "PWR": "PWR",
+    "VOL": "VOL",
+    "MAXVOL": "MAXVOL",
+    "MUTE": "MUTE",
+    "MUTEON": "MUTE",
+    "MUTEOFF": "MUTE",
+    "STREAMTYPE": "STREAMTYPE",
+    "AUDIOSTATUS": "AUDIOSTATUS",
+    "AUDIN": "AUDIN",
+    "AUDTYPE": "AUDTYPE",
+    "VIDIN": "VIDIN",
+    "VIDTYPE": "VIDTYPE",
+    "HDMIMAINOUT": "HDMIMAINOUT",
+    "LIPSYNCRANGE": "LIPSYNCRANGE",
+    "LIPSYNC": "LIPSYNC",
+    "DTSDIALOGAVAILABLE": "DTSDIALOGAVAILABLE",
+    "DTSDIALOG": "DTSDIALOG",
+    "LOUDNESS": "LOUDNESS",
+    "TRIMBASS": "TRIMBASS",
+    "TRIMTREB": "TRIMTREB",
+    "TRIMCENTER": "TRIMCENTER",
+    "TRIMHEIGHT": "TRIMHEIGHT",
+    "TRIMLFE": "TRIMLFE",
+    "TRIMSURRS": "TRIMSURRS",
+}
+
+
+@attr.define(slots=True)
+class DispatchStats:
+    """Counters and latency collected by the event dispatcher."""
+
+    dispatched: int = 0
+    max_depth: int = 0
+    merged: int = 0
+    overflows: int = 0
+    dropped: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    last_latency: float = 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """Return the mean seconds from arrival to dispatched."""
+        return self.total_latency / self.dispatched if self.dispatched else 0.0
+
+    def record(self, latency: float) -> None:
+        """Record the latency of a dispatched message."""
+        self.dispatched += 1
+        self.total_latency += latency
+        self.last_latency = latency
+        self.max_latency = max(self.max_latency, latency)
+
+
+@attr.define(slots=True)
+class _QueuedEvent:
+    """A message waiting to be dispatched, without message once superseded."""
+
+    received: float
+    message: str | None
+    parsed_message: LyngdorfParsedMessage
+    key: str | None
+
+
+@attr.define
+class EventDispatcher:
+    """
+    Run message handlers sequentially in arrival order.
+
+    Messages are queued as they are framed and drained by a single task,
+    which is started when the first message arrives and ends once the queue
+    is empty, so there is never more than one dispatch task alive.
+
+    A status event in supersede replaces a pending one of the same key,
+    which moves to the back of the queue. When more than limit messages are
+    pending, the queue is dropped and on_overflow is called to fetch the
+    state again, so the final state is never lost.
+    """
+
+    handler: Callable[[str, LyngdorfParsedMessage], Awaitable[None]] = attr.field()
+    supersede: Mapping[str, str] = attr.field(default=SUPERSEDING_EVENTS)
+    limit: int = attr.field(default=EVENT_QUEUE_LIMIT)
+    on_overflow: Callable[[], None] | None = attr.field(default=None)
+    stats: DispatchStats = attr.field(factory=DispatchStats, init=False)
+    _queue: collections.deque[_QueuedEvent] = attr.field(
+        factory=collections.deque, init=False
+    )
+    _pending: dict[str, _QueuedEvent] = attr.field(factory=dict, init=False)
+    _depth: int = attr.field(default=0, init=False)
+    _task: asyncio.Task[Any] | None = attr.field(default=None, init=False)
+
+    def put(self, message: str, parsed_message: LyngdorfParsedMessage) -> None:
+        """Queue a message and make sure the queue is being drained."""
+        key = (
+            self.supersede.get(parsed_message.event)
+            if message[0] == COMMAND_PREFIX
+            else None
+        )
+        event = _QueuedEvent(time.monotonic(), message, parsed_message, key)
+        if key is not None and (superseded := self._pending.get(key)) is not None:
+            superseded.message = None
+            self._depth -= 1
+            self.stats.merged += 1
+        elif self._depth >= self.limit:
+            self._overflow()
+        if key is not None:
+            self._pending[key] = event
+
+        self._queue.append(event)
+        self._depth += 1
+        self.stats.max_depth = max(self.stats.max_depth, self._depth)
+        if self._task is None:
+            self._task = asyncio.create_task(self._async_drain())
+
+    def _overflow(self) -> None:
+        """Drop the pending messages and have the state fetched again."""
+        _LOGGER.warning("Event queue overflow, dropping %d messages", self._depth)
+        self.stats.overflows += 1
+        self.stats.dropped += self._depth
+        self._queue.clear()
+        self._pending.clear()
+        self._depth = 0
+        if self.on_overflow is not None:
+            self.on_overflow()
+
+    async def _async_drain(self) -> None:
+        """Dispatch queued messages until the queue is empty."""
+        queue, pending = self._queue, self._pending
+        try:
+            while queue:
+                event = queue.popleft()
+                if (message := event.message) is None:
+                    continue
+                self._depth -= 1
+                if event.key is not None and pending.get(event.key) is event:
+                    del pending[event.key]
+                try:
+                    await self.handler(message, event.parsed_message)
+                except Exception:
+                    _LOGGER.exception("Dispatch of %s failed", message)
+                self.stats.record(time.monotonic() - event.received)
+        finally:
+            self._task = None
+
+    async def async_join(self) -> None:
+        """Wait until the queued messages have been dispatched."""
+        while (task := self._task) is not None and task is not asyncio.current_task():
+            await asyncio.shield(task)
+
+    async def async_stop(self) -> None:
+        """Drop queued messages and stop the dispatch task."""
+        self._queue.clear()
+        self._pending.clear()
+        self._depth = 0
+        task = self._task
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    @property
+    def depth(self) -> int:
+        """Return the number of messages waiting to be dispatched."""
+        return self._depth
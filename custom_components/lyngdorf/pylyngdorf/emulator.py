@@ -0,0 +1,567 @@
+#!/usr/bin/env python3
+"""
+Module implements a TCP emulator of Lyngdorf processors.
+
+:license: MIT, see LICENSE for more details.
+"""
+
+import argparse
+import asyncio
+import collections
+import contextlib
+import logging
+import random
+import re
+import time
+from collections.abc import Mapping
+from typing import Any, Final, Self
+
+import attr
+
+from .config import DEVICE_PROTOCOLS, TDAI_MODELS
+from .const import (
+    COMMAND_PREFIX,
+    DEFAULT_PORT,
+    ECHO_PREFIX,
+    DeviceModel,
+    LyngdorfCommand,
+    LyngdorfQuery,
+)
+from .framer import LineFramer
+
+_LOGGER = logging.getLogger(__name__)
+
+_COMMAND: Final = re.compile(r"(?P<name>[^(]+)(?:\((?P<arg>-?\d+)\))?$")
+
+# Status events whose names differ between the MP and TDAI dialects
+_MP_EVENTS: Final = {
+    "power": "POWER",
+    "source": "SRC",
+    "voicing_count": "RPVOICOUNT",
+    "voicing_item": "RPVOI",
+    "voicing": "RPVOI",
+    "focus_position_count": "RPFOCCOUNT",
+    "focus_position_item": "RPFOC",
+    "focus_position": "RPFOC",
+    "audio_type": "AUDTYPE",
+}
+_TDAI_EVENTS: Final = {
+    "power": "PWR",
+    "source": "SRCNAME",
+    "voicing_count": "VOICOUNT",
+    "voicing_item": "VOI",
+    "voicing": "VOINAME",
+    "focus_position_count": "RPCOUNT",
+    "focus_position_item": "RP",
+    "focus_position": "RPNAME",
+    "audio_type": "AUDIOSTATUS",
+}
+
+# Numeric settings: command -> (state field, direction), 0 sets the argument
+_NUMERIC: Final[Mapping[LyngdorfCommand, tuple[str, int]]] = {
+    LyngdorfCommand.VOLUME: ("volume", 0),
+    LyngdorfCommand.VOLUME_UP: ("volume", 1),
+    LyngdorfCommand.VOLUME_DOWN: ("volume", -1),
+    LyngdorfCommand.LIPSYNC: ("lipsync", 0),
+    LyngdorfCommand.LIPSYNC_UP: ("lipsync", 1),
+    LyngdorfCommand.LIPSYNC_DOWN: ("lipsync", -1),
+    LyngdorfCommand.DTS_DIALOG_UP: ("dts_dialog", 1),
+    LyngdorfCommand.DTS_DIALOG_DOWN: ("dts_dialog", -1),
+    LyngdorfCommand.BASS_TRIM: ("bass_trim", 0),
+    LyngdorfCommand.BASS_TRIM_UP: ("bass_trim", 1),
+    LyngdorfCommand.BASS_TRIM_DOWN: ("bass_trim", -1),
+    LyngdorfCommand.TREBLE_TRIM: ("treble_trim", 0),
+    LyngdorfCommand.TREBLE_TRIM_UP: ("treble_trim", 1),
+    LyngdorfCommand.TREBLE_TRIM_DOWN: ("treble_trim", -1),
+    LyngdorfCommand.CENTER_TRIM: ("center_trim", 0),
+    LyngdorfCommand.CENTER_TRIM_UP: ("center_trim", 1),
+    LyngdorfCommand.CENTER_TRIM_DOWN: ("center_trim", -1),
+    LyngdorfCommand.HEIGHTS_TRIM: ("heights_trim", 0),
+    LyngdorfCommand.HEIGHTS_TRIM_UP: ("heights_trim", 1),
+    LyngdorfCommand.HEIGHTS_TRIM_DOWN: ("heights_trim", -1),
+    LyngdorfCommand.LFE_TRIM: ("lfe_trim", 0),
+    LyngdorfCommand.LFE_TRIM_UP: ("lfe_trim", 1),
+    LyngdorfCommand.LFE_TRIM_DOWN: ("lfe_trim", -1),
+    LyngdorfCommand.SURROUNDS_TRIM: ("surrounds_trim", 0),
+    LyngdorfCommand.SURROUNDS_TRIM_UP: ("surrounds_trim", 1),
+    LyngdorfCommand.SURROUNDS_TRIM_DOWN: ("surrounds_trim", -1),
+}
+
+# Numeric state field -> (query, step, minimum, maximum)
+_RANGES: Final[Mapping[str, tuple[LyngdorfQuery, int, int, int]]] = {
+    "volume": (LyngdorfQuery.VOLUME, 5, -999, 240),
+    "lipsync": (LyngdorfQuery.LIPSYNC, 1, 0, 500),
+    "dts_dialog": (LyngdorfQuery.DTS_DIALOG, 10, 0, 60),
+    "bass_trim": (LyngdorfQuery.BASS_TRIM, 5, -120, 120),
+    "treble_trim": (LyngdorfQuery.TREBLE_TRIM, 5, -120, 120),
+    "center_trim": (LyngdorfQuery.CENTER_TRIM, 5, -100, 100),
+    "heights_trim": (LyngdorfQuery.HEIGHTS_TRIM, 5, -100, 100),
+    "lfe_trim": (LyngdorfQuery.LFE_TRIM, 5, -100, 100),
+    "surrounds_trim": (LyngdorfQuery.SURROUNDS_TRIM, 5, -100, 100),
+}
+
+# Enumerated selections: command -> (state field, direction), 0 selects the id
+_SELECTIONS: Final[Mapping[LyngdorfCommand, tuple[str, int]]] = {
+    LyngdorfCommand.SOURCE: ("source", 0),
+    LyngdorfCommand.SOURCE_NEXT: ("source", 1),
+    LyngdorfCommand.SOURCE_BUTTON: ("source", 1),
+    LyngdorfCommand.SOURCE_PREV: ("source", -1),
+    LyngdorfCommand.VOICING: ("voicing", 0),
+    LyngdorfCommand.VOICING_NEXT: ("voicing", 1),
+    LyngdorfCommand.VOICING_PREV: ("voicing", -1),
+    LyngdorfCommand.FOCUS_POSITION: ("focus_position", 0),
+    LyngdorfCommand.FOCUS_POSITION_NEXT: ("focus_position", 1),
+    LyngdorfCommand.FOCUS_POSITION_PREV: ("focus_position", -1),
+    LyngdorfCommand.AUDIO_MODE: ("audio_mode", 0),
+    LyngdorfCommand.AUDIO_MODE_NEXT: ("audio_mode", 1),
+    LyngdorfCommand.AUDIO_MODE_BUTTON: ("audio_mode", 1),
+    LyngdorfCommand.AUDIO_MODE_PREV: ("audio_mode", -1),
+}
+
+# Enumerated state field -> (items field, query)
+_ITEMS: Final[Mapping[str, tuple[str, LyngdorfQuery]]] = {
+    "source": ("sources", LyngdorfQuery.SOURCE),
+    "voicing": ("voicings", LyngdorfQuery.VOICING),
+    "focus_position": ("focus_positions", LyngdorfQuery.FOCUS_POSITION),
+    "audio_mode": ("audio_modes", LyngdorfQuery.AUDIO_MODE),
+}
+
+
+@attr.define
+class EmulatorState:
+    """Mutable state of an emulated processor, levels in tenths of a dB."""
+
+    power: bool = True
+    volume: int = -300
+    max_volume: int = 120
+    muted: bool = False
+    sources: dict[int, str] = attr.field(
+        factory=lambda: {
+            1: "HDMI 1",
+            2: "TV",
+            3: "Internal Player",
+            4: "Roon",
+            5: "Optical",
+            6: "Analog XLR",
+        }
+    )
+    source: int = 2
+    stream_type: int = 0
+    voicings: dict[int, str] = attr.field(
+        factory=lambda: {1: "Neutral", 2: "Music", 3: "Movie", 4: "Night"}
+    )
+    voicing: int = 1
+    focus_positions: dict[int, str] = attr.field(
+        factory=lambda: {0: "Global", 1: "Sofa", 2: "Desk"}
+    )
+    focus_position: int = 1
+    audio_modes: dict[int, str] = attr.field(
+        factory=lambda: {
+            0: "None",
+            1: "Dolby Upmixer",
+            2: "DTS Neural:X",
+            3: "Auro-Matic",
+        }
+    )
+    audio_mode: int = 1
+    audio_input: int = 1
+    audio_type: tuple[str, ...] = ("Dolby Atmos", "7.1.4")
+    video_input: int = 1
+    video_type: str = "3840x2160p60 HDR10"
+    video_output: int = 1
+    lipsync: int = 20
+    min_lipsync: int = 0
+    max_lipsync: int = 500
+    dts_dialog_available: bool = False
+    dts_dialog: int = 0
+    loudness: bool = True
+    bass_trim: int = -15
+    treble_trim: int = 5
+    center_trim: int = 10
+    heights_trim: int = 0
+    lfe_trim: int = -20
+    surrounds_trim: int = 0
+
+
+class _EmulatorProtocol(asyncio.Protocol):
+    """Connection of a client to the emulator."""
+
+    def __init__(self, emulator: "LyngdorfEmulator") -> None:
+        """Initialise the protocol."""
+        self.emulator = emulator
+        self.framer = LineFramer(self._on_line)
+        self.transport: asyncio.Transport | None = None
+        self.verbose = 0
+        self._outbox: collections.deque[tuple[float, bytes]] = collections.deque()
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Handle connection made."""
+        self.transport = transport  # type: ignore
+        self.emulator._clients.add(self)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Handle connection lost."""
+        self.emulator._clients.discard(self)
+        self.transport = None
+        self.close()
+
+    def data_received(self, data: bytes) -> None:
+        """Handle data received."""
+        self.framer.feed(data)
+
+    def send(self, lines: list[str], delay: float) -> None:
+        """Write lines after a delay, never ahead of earlier replies."""
+        loop = asyncio.get_running_loop()
+        due = loop.time() + delay
+        if self._outbox and self._outbox[-1][0] > due:
+            due = self._outbox[-1][0]
+        data = "".join(f"{line}\r\n" for line in lines).encode("utf-8")
+        self._outbox.append((due, data))
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_at(due, self._flush)
+
+    def close(self) -> None:
+        """Close the connection."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._outbox.clear()
+        if self.transport is not None:
+            self.transport.close()
+
+    def _flush(self) -> None:
+        """Write the replies that are due and wait for the next one."""
+        loop = asyncio.get_running_loop()
+        now, outbox = loop.time(), self._outbox
+        chunks: list[bytes] = []
+        while outbox and outbox[0][0] <= now:
+            chunks.append(outbox.popleft()[1])
+        if chunks and self.transport is not None and not self.transport.is_closing():
+            self.transport.write(b"".join(chunks))
+        self._flush_handle = loop.call_at(outbox[0][0], self._flush) if outbox else None
+
+    def _on_line(self, line: str) -> None:
+        """Handle a command line."""
+        if line.startswith(COMMAND_PREFIX):
+            self.emulator._handle(self, line[1:])
+
+
+@attr.define
+class LyngdorfEmulator:
+    """
+    Emulate the control interface of a Lyngdorf processor.
+
+    Every command is echoed with '#', queries are answered with '!' status
+    lines, and state changes are pushed to clients in verbose mode. Replies
+    are delayed by the latency (or the command_latency of the command name)
+    plus a uniform jitter, keeping the order per client. With an event rate,
+    the emulator also changes volume, stream type and audio type on its own.
+    """
+
+    model: DeviceModel = attr.field(default=DeviceModel.MP60, converter=DeviceModel)
+    host: str = attr.field(default="127.0.0.1")
+    port: int = attr.field(converter=int, default=DEFAULT_PORT)
+    latency: float = attr.field(converter=float, default=0.0)
+    jitter: float = attr.field(converter=float, default=0.0)
+    command_latency: Mapping[str, float] = attr.field(factory=dict)
+    event_rate: float = attr.field(converter=float, default=0.0)
+    seed: int | None = attr.field(default=None)
+    state: EmulatorState = attr.field(factory=EmulatorState)
+    commands_handled: int = attr.field(default=0, init=False)
+    _events: Mapping[str, str] = attr.field(init=False)
+    _commands: dict[str, LyngdorfCommand] = attr.field(init=False)
+    _queries: dict[str, LyngdorfQuery] = attr.field(init=False)
+    _random: random.Random = attr.field(init=False)
+    _server: asyncio.Server | None = attr.field(default=None, init=False)
+    _event_task: asyncio.Task[Any] | None = attr.field(default=None, init=False)
+    _clients: set[_EmulatorProtocol] = attr.field(factory=set, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        """Initialise the dialect of the model."""
+        protocol = DEVICE_PROTOCOLS[self.model]
+        self._events = _TDAI_EVENTS if self.model in TDAI_MODELS else _MP_EVENTS
+        self._commands = {
+            definition.template.split("(")[0]: command
+            for command, definition in protocol.commands.commands.items()
+        }
+        self._queries = {key: query for query, key in protocol.queries.items()}
+        self._random = random.Random(self.seed)
+
+    async def async_start(self) -> None:
+        """Start listening, on a free port if the port is 0."""
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(
+            lambda: _EmulatorProtocol(self), self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        if self.event_rate > 0:
+            self._event_task = asyncio.create_task(self._async_emit_events())
+        _LOGGER.debug("Emulating %s on %s:%d", self.model.value, self.host, self.port)
+
+    async def async_stop(self) -> None:
+        """Stop listening and close all connections."""
+        if self._event_task is not None:
+            self._event_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._event_task
+            self._event_task = None
+        self.disconnect_clients()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def disconnect_clients(self) -> None:
+        """Drop every client connection, e.g. to exercise reconnects."""
+        for client in list(self._clients):
+            client.close()
+
+    async def __aenter__(self) -> Self:
+        await self.async_start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.async_stop()
+
+    @property
+    def clients(self) -> int:
+        """Return the number of connected clients."""
+        return len(self._clients)
+
+    def _delay(self, name: str) -> float:
+        """Return the reply delay of a command."""
+        delay = self.command_latency.get(name, self.latency)
+        if self.jitter:
+            delay += self._random.uniform(-self.jitter, self.jitter)
+        return max(delay, 0.0)
+
+    def _handle(self, client: _EmulatorProtocol, command: str) -> None:
+        """Answer a command of a client."""
+        self.commands_handled += 1
+        replies = [f"{ECHO_PREFIX}{command}"]
+        changed: LyngdorfQuery | None = None
+
+        if command.endswith("?"):
+            name = command
+            if (query := self._queries.get(command)) is not None:
+                replies.extend(self._status(query))
+        elif match := _COMMAND.match(command):
+            name, arg = match["name"], match["arg"]
+            if (lyngdorf_command := self._commands.get(name)) is not None:
+                changed = self._apply(
+                    client, lyngdorf_command, int(arg) if arg is not None else None
+                )
+        else:
+            name = command
+
+        delay = self._delay(name)
+        client.send(replies, delay)
+        if changed is not None:
+            self._push(self._status(changed), delay)
+
+    def _push(self, lines: list[str], delay: float = 0.0) -> None:
+        """Send status lines to the clients in verbose mode."""
+        for client in self._clients:
+            if client.verbose:
+                client.send(lines, delay)
+
+    def _apply(
+        self, client: _EmulatorProtocol, command: LyngdorfCommand, arg: int | None
+    ) -> LyngdorfQuery | None:
+        """Apply a command and return the query of the changed state."""
+        state = self.state
+        if command is LyngdorfCommand.VERBOSE:
+            client.verbose = arg or 0
+            return None
+        if command in (LyngdorfCommand.POWER_ON, LyngdorfCommand.POWER_OFF):
+            state.power = command is LyngdorfCommand.POWER_ON
+            return LyngdorfQuery.POWER
+        if command in (LyngdorfCommand.MUTE_ON, LyngdorfCommand.MUTE_OFF):
+            state.muted = command is LyngdorfCommand.MUTE_ON
+            return LyngdorfQuery.MUTE
+
+        if command in _NUMERIC:
+            field, direction = _NUMERIC[command]
+            query, step, low, high = _RANGES[field]
+            if field == "volume":
+                high = state.max_volume
+            elif field == "lipsync":
+                low, high = state.min_lipsync, state.max_lipsync
+            value = getattr(state, field) + direction * step if direction else arg
+            if value is None:
+                return None
+            setattr(state, field, min(max(value, low), high))
+            return query
+
+        if command in _SELECTIONS:
+            field, direction = _SELECTIONS[command]
+            items_field, query = _ITEMS[field]
+            ids = sorted(getattr(state, items_field))
+            if direction:
+                index = ids.index(getattr(state, field)) if ids else 0
+                arg = ids[(index + direction) % len(ids)] if ids else None
+            if arg not in ids:
+                return None
+            setattr(state, field, arg)
+            return query
+
+        return None
+
+    def _status(self, query: LyngdorfQuery) -> list[str]:
+        """Return the status lines answering a query."""
+        state, events = self.state, self._events
+
+        def items(name: str, values: dict[int, str]) -> list[str]:
+            return [f"!{events[name + '_count']}({len(values)})"] + [
+                f'!{events[name + "_item"]}({item_id},"{value}")'
+                for item_id, value in sorted(values.items())
+            ]
+
+        def selected(event: str, item_id: int, values: dict[int, str]) -> list[str]:
+            return [f'!{event}({item_id})"{values.get(item_id, "")}"']
+
+        match query:
+            case LyngdorfQuery.VERBOSE:
+                return []
+            case LyngdorfQuery.DEVICE:
+                return [f"!DEVICE({self.model.value})"]
+            case LyngdorfQuery.POWER:
+                return [f"!{events['power']}({int(state.power)})"]
+            case LyngdorfQuery.MAX_VOLUME:
+                return [f"!MAXVOL({state.max_volume})"]
+            case LyngdorfQuery.VOLUME:
+                return [f"!VOL({state.volume})"]
+            case LyngdorfQuery.MUTE:
+                return ["!MUTEON" if state.muted else "!MUTEOFF"]
+            case LyngdorfQuery.SOURCE_LIST:
+                return [f"!SRCCOUNT({len(state.sources)})"] + [
+                    f'!SRC({item_id},"{value}")'
+                    for item_id, value in sorted(state.sources.items())
+                ]
+            case LyngdorfQuery.SOURCE:
+                return selected(events["source"], state.source, state.sources)
+            case LyngdorfQuery.STREAM_TYPE:
+                return [f"!STREAMTYPE({state.stream_type})"]
+            case LyngdorfQuery.VOICING_LIST:
+                return items("voicing", state.voicings)
+            case LyngdorfQuery.VOICING:
+                return selected(events["voicing"], state.voicing, state.voicings)
+            case LyngdorfQuery.FOCUS_POSITION_LIST:
+                return items("focus_position", state.focus_positions)
+            case LyngdorfQuery.FOCUS_POSITION:
+                return selected(
+                    events["focus_position"],
+                    state.focus_position,
+                    state.focus_positions,
+                )
+            case LyngdorfQuery.AUDIO_MODE_LIST:
+                return [f"!AUDMODECOUNT({len(state.audio_modes)})"] + [
+                    f'!AUDMODE({item_id},"{value}")'
+                    for item_id, value in sorted(state.audio_modes.items())
+                ]
+            case LyngdorfQuery.AUDIO_MODE:
+                return selected("AUDMODE", state.audio_mode, state.audio_modes)
+            case LyngdorfQuery.AUDIO_INPUT:
+                return [f"!AUDIN({state.audio_input})"]
+            case LyngdorfQuery.AUDIO_TYPE:
+                values = ",".join(f'"{value}"' for value in state.audio_type)
+                return [f"!{events['audio_type']}({values})"]
+            case LyngdorfQuery.VIDEO_INPUT:
+                return [f"!VIDIN({state.video_input})"]
+            case LyngdorfQuery.VIDEO_TYPE:
+                return [f'!VIDTYPE("{state.video_type}")']
+            case LyngdorfQuery.VIDEO_OUTPUT:
+                return [f"!HDMIMAINOUT({state.video_output})"]
+            case LyngdorfQuery.LIPSYNC_RANGE:
+                return [f"!LIPSYNCRANGE({state.min_lipsync},{state.max_lipsync})"]
+            case LyngdorfQuery.LIPSYNC:
+                return [f"!LIPSYNC({state.lipsync})"]
+            case LyngdorfQuery.DTS_DIALOG_AVAILABLE:
+                return [f"!DTSDIALOGAVAILABLE({int(state.dts_dialog_available)})"]
+            case LyngdorfQuery.DTS_DIALOG:
+                return [f"!DTSDIALOG({state.dts_dialog})"]
+            case LyngdorfQuery.LOUDNESS:
+                return [f"!LOUDNESS({int(state.loudness)})"]
+            case LyngdorfQuery.BASS_TRIM:
+                return [f"!TRIMBASS({state.bass_trim})"]
+            case LyngdorfQuery.TREBLE_TRIM:
+                return [f"!TRIMTREB({state.treble_trim})"]
+            case LyngdorfQuery.CENTER_TRIM:
+                return [f"!TRIMCENTER({state.center_trim})"]
+            case LyngdorfQuery.HEIGHTS_TRIM:
+                return [f"!TRIMHEIGHT({state.heights_trim})"]
+            case LyngdorfQuery.LFE_TRIM:
+                return [f"!TRIMLFE({state.lfe_trim})"]
+            case LyngdorfQuery.SURROUNDS_TRIM:
+                return [f"!TRIMSURRS({state.surrounds_trim})"]
+        return []
+
+    async def _async_emit_events(self) -> None:
+        """Change state on the device side at the configured event rate."""
+        state = self.state
+        while True:
+            await asyncio.sleep(self._random.expovariate(self.event_rate))
+            kind = self._random.randrange(3)
+            if kind == 0:
+                state.volume = min(
+                    max(state.volume + self._random.choice((-5, 5)), -999),
+                    state.max_volume,
+                )
+                query = LyngdorfQuery.VOLUME
+            elif kind == 1:
+                state.stream_type = self._random.choice(
+                    [key for key in DEVICE_PROTOCOLS[self.model].stream_types] or [0]
+                )
+                query = LyngdorfQuery.STREAM_TYPE
+            else:
+                state.audio_type = self._random.choice(
+                    (("Dolby Atmos", "7.1.4"), ("PCM", "2.0"), ("DTS:X", "5.1.2"))
+                )
+                query = LyngdorfQuery.AUDIO_TYPE
+            self._push(self._status(query), self._delay(""))
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Run an emulator until interrupted."""
+    emulator = LyngdorfEmulator(
+        model=args.model,
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        event_rate=args.event_rate,
+        seed=args.seed,
+    )
+    async with emulator:
+        print(f"Emulating {emulator.model.value} on {emulator.host}:{emulator.port}")
+        started = time.monotonic()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            print(
+                f"Handled {emulator.commands_handled} commands "
+                f"in {time.monotonic() - started:.0f}s"
+            )
+
+
+def main() -> None:
+    """Run the emulator from the command line."""
+    parser = argparse.ArgumentParser(description="Emulate a Lyngdorf processor.")
+    parser.add_argument(
+        "--model",
+        default=DeviceModel.MP60.value,
+        choices=[model.value for model in DEVICE_PROTOCOLS],
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--event-rate", type=float, default=0.0, help="events/s")
+    parser.add_argument("--seed", type=int)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Module implements the line framer for the Lyngdorf protocol.
+
+:license: MIT, see LICENSE for more details.
+"""
+
+import re
+from collections.abc import Callable
+from typing import Final
+
+import attr
+
+from .const import MAX_LINE_LENGTH
+
+_LINE_END: Final = re.compile(rb"[\r\n]+")
+
+
+@attr.define(slots=True)
+class LineFramerStats:
+    """Counters collected by the line framer."""
+
+    lines: int = 0
+    overlong_lines: int = 0
+    undecodable_lines: int = 0
+    compactions: int = 0
+
+
+@attr.define(slots=True)
+class LineFramer:
+    """
+    Split a byte stream into protocol lines.
+
+    Incoming segments are appended to a bytearray and scanned from the last
+    offset, so a partial line is never searched twice. Complete lines are
+    sliced out as memoryviews and decoded in place; the consumed prefix of
+    the buffer is dropped once per segment.
+    """
+
+    on_line: Callable[[str], None] = attr.field()
+    max_line_length: int = attr.field(default=MAX_LINE_LENGTH)
+    stats: LineFramerStats = attr.field(factory=LineFramerStats, init=False)
+    _buffer: bytearray = attr.field(factory=bytearray, init=False)
+    _scan_offset: int = attr.field(default=0, init=False)
+    _discarding: bool = attr.field(default=False, init=False)
+
+    def feed(self, data: bytes) -> None:
+        """Feed a received segment and emit every complete line."""
+        buffer = self._buffer
+        buffer += data
+        start = 0
+
+        with memoryview(buffer) as view:
+            for match in _LINE_END.finditer(buffer, self._scan_offset):
+                end = match.start()
+                if self._discarding:
+                    # Tail of a line that already overflowed the limit
+                    self._discarding = False
+                elif end - start > self.max_line_length:
+                    self.stats.overlong_lines += 1
+                elif end > start:
+                    self._emit(view[start:end])
+                start = match.end()
+
+        pending = len(buffer) - start
+        if pending > self.max_line_length:
+            if not self._discarding:
+                self.stats.overlong_lines += 1
+                self._discarding = True
+            start = len(buffer)
+            pending = 0
+
+        if start:
+            del buffer[:start]
+            self.stats.compactions += 1
+
+        # A trailing separator may be completed by the next segment
+        # (b"\r" | b"\n"), so only skip the bytes known to hold no separator.
+        self._scan_offset = pending
+
+    def reset(self) -> None:
+        """Drop any partially received line."""
+        self._buffer.clear()
+        self._scan_offset = 0
+        self._discarding = False
+
+    def _emit(self, line: memoryview) -> None:
+        """Decode a line and pass it on."""
+        try:
+            text = str(line, "utf-8")
+        except UnicodeDecodeError:
+            self.stats.undecodable_lines += 1
+            return
+        finally:
+            line.release()
+        self.stats.lines += 1
+        self.on_line(text)
+
+    @property
+    def buffered(self) -> int:
+        """Return the number of bytes waiting for a line terminator."""
+        return len(self._buffer)
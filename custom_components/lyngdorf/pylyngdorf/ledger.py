@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Module implements the command confirmation ledger for Lyngdorf devices.
+
+:license: MIT, see LICENSE for more details.
+"""
+
+import asyncio
+import collections
+import itertools
+import logging
+import time
+from collections.abc import Mapping
+from types import MappingProxyType
+
+import attr
+
+from .const import LATE_ECHO_WINDOW
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@attr.define(slots=True, eq=False)
+class PendingConfirmation:
+    """A command written to the processor and waiting for its echo."""
+
+    seq: int
+    command: str
+    sent_at: float
+    future: asyncio.Future[None]
+    expired: bool = False
+
+
+@attr.define(slots=True)
+class CommandLatency:
+    """Confirmation latency statistics of a command."""
+
+    count: int = 0
+    late: int = 0
+    timeouts: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    last: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        """Return the mean confirmation latency in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def record(self, latency: float) -> None:
+        """Record the latency of a confirmation."""
+        self.count += 1
+        self.total += latency
+        self.last = latency
+        self.max = max(self.max, latency)
+
+
+@attr.define
+class ConfirmationLedger:
+    """
+    Match command echoes to their senders.
+
+    Every written command gets an entry with a sequence id and send time,
+    queued per command string. An echo resolves the oldest live entry for its
+    command, so identical commands in flight are confirmed in the order they
+    were sent, and the expired entries queued before it are dropped since
+    their echoes were lost. An entry whose sender stopped waiting stays
+    queued as expired for LATE_ECHO_WINDOW seconds, so an echo arriving while
+    no live entry waits is attributed to it as late. The queues of all commands are swept for
+    such entries at most once per window. Latency statistics are kept per
+    command name, e.g. VOL for every VOL(n).
+    """
+
+    late_echo_window: float = attr.field(converter=float, default=LATE_ECHO_WINDOW)
+    _sequence: itertools.count = attr.field(factory=itertools.count, init=False)
+    _entries: dict[str, collections.deque[PendingConfirmation]] = attr.field(
+        factory=dict, init=False
+    )
+    _latency: dict[str, CommandLatency] = attr.field(factory=dict, init=False)
+    _next_sweep: float = attr.field(default=0.0, init=False)
+
+    def register(self, command: str) -> PendingConfirmation:
+        """Add an entry for a command that is about to be written."""
+        entry = PendingConfirmation(
+            seq=next(self._sequence),
+            command=command,
+            sent_at=time.monotonic(),
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self._sweep(entry.sent_at)
+        entries = self._entries.setdefault(command, collections.deque())
+        self._prune(entries, entry.sent_at)
+        entries.append(entry)
+        return entry
+
+    def confirm(self, command: str) -> PendingConfirmation | None:
+        """Resolve the oldest live entry of an echoed command."""
+        entries = self._entries.get(command)
+        if not entries:
+            return None
+
+        now = time.monotonic()
+        self._prune(entries, now)
+        if not entries:
+            del self._entries[command]
+            return None
+
+        if any(_live(entry) for entry in entries):
+            while not _live(entries[0]):
+                entries.popleft()
+        entry = entries.popleft()
+        if not entries:
+            del self._entries[command]
+
+        stats = self._stats(command)
+        stats.record(now - entry.sent_at)
+        if entry.expired or entry.future.cancelled():
+            stats.late += 1
+            _LOGGER.debug(
+                "Late confirmation of %s (#%d) after %.3fs",
+                command,
+                entry.seq,
+                now - entry.sent_at,
+            )
+        elif not entry.future.done():
+            entry.future.set_result(None)
+        return entry
+
+    def expire(self, entry: PendingConfirmation, timed_out: bool = True) -> None:
+        """Mark an entry whose sender is no longer waiting."""
+        if entry.expired or (entry.future.done() and not entry.future.cancelled()):
+            return
+        entry.expired = True
+        entry.future.cancel()
+        if timed_out:
+            self._stats(entry.command).timeouts += 1
+        self._sweep(time.monotonic())
+
+    def pending(self, command: str | None = None) -> int:
+        """Return the number of entries still waiting for an echo."""
+        if command is not None:
+            return sum(not entry.expired for entry in self._entries.get(command, ()))
+        return sum(
+            not entry.expired for entries in self._entries.values() for entry in entries
+        )
+
+    def slowest(self, count: int = 5) -> list[tuple[str, CommandLatency]]:
+        """Return the command names with the highest mean confirmation latency."""
+        return sorted(
+            self._latency.items(), key=lambda item: item[1].mean, reverse=True
+        )[:count]
+
+    @property
+    def latency(self) -> Mapping[str, CommandLatency]:
+        """Return the confirmation latency statistics per command name."""
+        return MappingProxyType(self._latency)
+
+    def _stats(self, command: str) -> CommandLatency:
+        """Return the statistics of the name of a command."""
+        name = command.partition("(")[0]
+        if (stats := self._latency.get(name)) is None:
+            stats = self._latency[name] = CommandLatency()
+        return stats
+
+    def _sweep(self, now: float) -> None:
+        """Drop old expired entries of all commands, once per window."""
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + self.late_echo_window
+        for command in list(self._entries):
+            entries = self._entries[command]
+            self._prune(entries, now)
+            if not entries:
+                del self._entries[command]
+
+    def _prune(
+        self, entries: collections.deque[PendingConfirmation], now: float
+    ) -> None:
+        """Drop expired entries that are too old to expect an echo for."""
+        while (
+            entries
+            and entries[0].expired
+            and now - entries[0].sent_at > self.late_echo_window
+        ):
+            entries.popleft()
+
+
+def _live(entry: PendingConfirmation) -> bool:
+    """Return True while the sender of an entry waits for its echo."""
+    return not entry.expired and not entry.future.cancelled()
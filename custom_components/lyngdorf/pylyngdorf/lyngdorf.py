@@ -5,20 +5,29 @@ Module implements the interface to Lyngdorf devices.
 :license: MIT, see LICENSE for more details.
 """
 
+from collections.abc import Mapping
 from typing import Any, TypeVar
 
+import aiohttp
 import attr
 
 from .const import (
     DEFAULT_PORT,
     MIN_VOLUME_DB,
+    PIPELINE_WINDOW,
     TRIM_RANGE_BASS_TREBLE,
     TRIM_RANGE_CHANNEL,
     DeviceModel,
     LyngdorfCommand,
+    LyngdorfSetting,
 )
-from .device import LyngdorfDevice
+from .debounce import CommandDebouncer, DebounceStats
+from .device import LyngdorfDevice, NotificationStats
 from .music_player import MediaData, RepeatMode
+from .ramp import RampStats, VolumeRamp
+from .registry import CONNECTIONS
+from .snapshot import DeviceSnapshot
+from .utils import db_to_tenths
 
 T = TypeVar("T", bound="Lyngdorf")
 
@@ -31,6 +40,31 @@ def validate_trim(trim: float, range_: float) -> None:
         )
 
 
+# Settings selecting an item of a list, by command and list attribute
+_ITEM_SETTINGS: dict[LyngdorfSetting, tuple[LyngdorfCommand, str]] = {
+    LyngdorfSetting.SOURCE: (LyngdorfCommand.SOURCE, "_sources"),
+    LyngdorfSetting.AUDIO_MODE: (LyngdorfCommand.AUDIO_MODE, "_audio_modes"),
+    LyngdorfSetting.VOICING: (LyngdorfCommand.VOICING, "_voicings"),
+    LyngdorfSetting.FOCUS_POSITION: (
+        LyngdorfCommand.FOCUS_POSITION,
+        "_focus_positions",
+    ),
+}
+
+# Trim settings, by command and dB range
+_TRIM_SETTINGS: dict[LyngdorfSetting, tuple[LyngdorfCommand, float]] = {
+    LyngdorfSetting.BASS_TRIM: (LyngdorfCommand.BASS_TRIM, TRIM_RANGE_BASS_TREBLE),
+    LyngdorfSetting.TREBLE_TRIM: (LyngdorfCommand.TREBLE_TRIM, TRIM_RANGE_BASS_TREBLE),
+    LyngdorfSetting.CENTER_TRIM: (LyngdorfCommand.CENTER_TRIM, TRIM_RANGE_CHANNEL),
+    LyngdorfSetting.HEIGHTS_TRIM: (LyngdorfCommand.HEIGHTS_TRIM, TRIM_RANGE_CHANNEL),
+    LyngdorfSetting.LFE_TRIM: (LyngdorfCommand.LFE_TRIM, TRIM_RANGE_CHANNEL),
+    LyngdorfSetting.SURROUNDS_TRIM: (
+        LyngdorfCommand.SURROUNDS_TRIM,
+        TRIM_RANGE_CHANNEL,
+    ),
+}
+
+
 @attr.define()
 class Lyngdorf(LyngdorfDevice):
     """Implements a class with device information."""
@@ -47,6 +81,8 @@ class Lyngdorf(LyngdorfDevice):
         port: int = DEFAULT_PORT,
         timeout: float = 2.0,
         device_model: DeviceModel | None = None,
+        pipeline_window: int = PIPELINE_WINDOW,
+        session: aiohttp.ClientSession | None = None,
     ) -> T:
         instance = object.__new__(cls)
         cls.__init__(
@@ -54,7 +90,9 @@ class Lyngdorf(LyngdorfDevice):
             host=host,
             port=port,
             timeout=timeout,
+            pipeline_window=pipeline_window,
             device_model=device_model,
+            session=session,
         )
 
         return instance
@@ -62,17 +100,48 @@ class Lyngdorf(LyngdorfDevice):
     def __attrs_post_init__(self) -> None:
         """Initialise attributes."""
         super().__attrs_post_init__()
+        self._volume_ramp = VolumeRamp(self._async_write_volume, lambda: self._volume)
+        self._debouncer = CommandDebouncer(self.async_send_command)
 
     async def async_connect(self) -> None:
-        """Connect to the interface of the device."""
+        """
+        Connect to the interface of the device.
+
+        Devices of the same host and port share the connection of the first
+        one, see registry.ConnectionRegistry.
+        """
+        if self._connection is None:
+            self._connection = CONNECTIONS.acquire(self.host, self.port, self._api)
+            self._api = self._connection.api
         self._register_callbacks()
-        await self._api.async_connect()
+        try:
+            async with self.transaction():
+                await self._connection.async_connect()
+        except BaseException:
+            await self._async_release_connection()
+            raise
 
     async def async_disconnect(self) -> None:
         """Disconnect from the interface of the device."""
-        await self._api.async_disconnect()
+        self._volume_ramp.cancel()
+        self._debouncer.cancel()
+        await self._async_release_connection()
         await self._async_handle_poller(False)
 
+    async def _async_release_connection(self) -> None:
+        """
+        Release the shared connection, closing it after the last device.
+
+        The device gets its own API back. Without a connection, the shared
+        API may still be used by other devices and is left alone.
+        """
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        self._unregister_callbacks()
+        self._api = self._own_api
+        await connection.async_release()
+
     ##############
     # Properties #
     ##############
@@ -117,8 +186,8 @@ class Lyngdorf(LyngdorfDevice):
         return self._max_volume
 
     @property
-    def sources(self) -> list[str]:
-        """Return the sources of the device as list."""
+    def sources(self) -> tuple[str, ...]:
+        """Return the sources of the device as tuple."""
         return self._sources.get_all()
 
     @property
@@ -132,8 +201,8 @@ class Lyngdorf(LyngdorfDevice):
         return self._stream_type
 
     @property
-    def voicings(self) -> list[str]:
-        """Return the voicings of the device as list."""
+    def voicings(self) -> tuple[str, ...]:
+        """Return the voicings of the device as tuple."""
         return self._voicings.get_all()
 
     @property
@@ -142,8 +211,8 @@ class Lyngdorf(LyngdorfDevice):
         return self._voicing
 
     @property
-    def focus_positions(self) -> list[str]:
-        """Return the focus positions of the device as list."""
+    def focus_positions(self) -> tuple[str, ...]:
+        """Return the focus positions of the device as tuple."""
         return self._focus_positions.get_all()
 
     @property
@@ -152,8 +221,8 @@ class Lyngdorf(LyngdorfDevice):
         return self._focus_position
 
     @property
-    def audio_modes(self) -> list[str]:
-        """Return the audio modes of the device as list."""
+    def audio_modes(self) -> tuple[str, ...]:
+        """Return the audio modes of the device as tuple."""
         return self._audio_modes.get_all()
 
     @property
@@ -251,6 +320,21 @@ class Lyngdorf(LyngdorfDevice):
         """Return the media data from the music player."""
         return self._media_data
 
+    @property
+    def notification_stats(self) -> NotificationStats:
+        """Return the counters of delivered and suppressed notifications."""
+        return self._notification_stats
+
+    @property
+    def volume_ramp_stats(self) -> RampStats:
+        """Return the counters of the volume ramp."""
+        return self._volume_ramp.stats
+
+    @property
+    def debounce_stats(self) -> DebounceStats:
+        """Return the counters of the debounced setters."""
+        return self._debouncer.stats
+
     ##########
     # Setter #
     ##########
@@ -281,26 +365,55 @@ class Lyngdorf(LyngdorfDevice):
 
     async def async_volume_up(self) -> None:
         """Increase volume."""
+        self._volume_ramp.cancel()
         await self.async_send_command(LyngdorfCommand.VOLUME_UP, skip_confirmation=True)
 
     async def async_volume_down(self) -> None:
         """Decrease volume."""
+        self._volume_ramp.cancel()
         await self.async_send_command(
             LyngdorfCommand.VOLUME_DOWN, skip_confirmation=True
         )
 
-    async def async_set_volume(self, volume: float) -> None:
-        """Set device volume."""
+    def _validate_volume(self, volume: float) -> None:
         if volume < MIN_VOLUME_DB or volume > self.max_volume:
             raise ValueError(f"Invalid volume: {volume}")
 
-        await self.async_send_command(LyngdorfCommand.VOLUME, int(volume * 10))
+    async def _async_write_volume(self, volume: float) -> None:
+        await self.async_send_command(LyngdorfCommand.VOLUME, db_to_tenths(volume))
+
+    async def async_set_volume(self, volume: float) -> None:
+        """Set device volume."""
+        self._validate_volume(volume)
+        self._volume_ramp.cancel()
+        await self.async_send_command(LyngdorfCommand.VOLUME, db_to_tenths(volume))
 
     async def async_set_volume_level(self, volume: float) -> None:
         """Set device volume level (0.0–1.0)."""
         db = self._linear_to_db_flattened(volume)
         await self.async_set_volume(db)
 
+    async def async_ramp_volume(
+        self, volume: float, duration: float | None = None
+    ) -> None:
+        """
+        Move device volume towards volume, over duration seconds if given.
+
+        The latest call wins: a running ramp takes the new target, and the
+        callers of superseded targets return without waiting.
+        """
+        self._validate_volume(volume)
+        if duration is not None and duration < 0:
+            raise ValueError(f"Invalid duration: {duration}")
+        await self._volume_ramp.async_move(volume, duration)
+
+    async def async_ramp_volume_level(
+        self, volume: float, duration: float | None = None
+    ) -> None:
+        """Move device volume level (0.0–1.0) towards volume."""
+        db = self._linear_to_db_flattened(volume)
+        await self.async_ramp_volume(db, duration)
+
     async def async_mute(self, mute: bool) -> None:
         """Mute or unmute the device."""
         await self.async_send_command(
@@ -315,12 +428,12 @@ class Lyngdorf(LyngdorfDevice):
     async def async_set_voicing(self, voicing: str) -> None:
         """Set voicing of device."""
         if (index := self._voicings.get_by_value(voicing)) is not None:
-            await self.async_send_command(LyngdorfCommand.VOICING, index)
+            await self._debouncer.async_send(LyngdorfCommand.VOICING, index)
 
     async def async_set_focus_position(self, focus_position: str) -> None:
         """Set focus position of device."""
         if (index := self._focus_positions.get_by_value(focus_position)) is not None:
-            await self.async_send_command(LyngdorfCommand.FOCUS_POSITION, index)
+            await self._debouncer.async_send(LyngdorfCommand.FOCUS_POSITION, index)
 
     async def async_set_audio_mode(self, audio_mode: str) -> None:
         """Set audio mode of device."""
@@ -332,7 +445,7 @@ class Lyngdorf(LyngdorfDevice):
         if lipsync < self.min_lipsync or lipsync > self.max_lipsync:
             raise ValueError(f"Invalid lipsync: {lipsync}")
 
-        await self.async_send_command(LyngdorfCommand.LIPSYNC, lipsync)
+        await self._debouncer.async_send(LyngdorfCommand.LIPSYNC, lipsync)
 
     async def async_play(self) -> None:
         """Send play command."""
@@ -378,7 +491,7 @@ class Lyngdorf(LyngdorfDevice):
         self, command: LyngdorfCommand, trim: float, range_: float
     ) -> None:
         validate_trim(trim, range_)
-        await self.async_send_command(command, int(trim * 10))
+        await self._debouncer.async_send(command, db_to_tenths(trim))
 
     async def async_set_bass_trim(self, trim: float) -> None:
         """Set bass trim."""
@@ -403,3 +516,92 @@ class Lyngdorf(LyngdorfDevice):
     async def async_set_surrounds_trim(self, trim: float) -> None:
         """Set surround channels trim."""
         await self._set_trim(LyngdorfCommand.SURROUNDS_TRIM, trim, TRIM_RANGE_CHANNEL)
+
+    def _setting_command(self, setting: LyngdorfSetting, value: Any) -> str:
+        """Validate the value of a setting and return its command."""
+        arg: Any = None
+        if setting in _ITEM_SETTINGS:
+            command, items = _ITEM_SETTINGS[setting]
+            arg = getattr(self, items).get_by_value(value)
+            if arg is None:
+                raise ValueError(f"Invalid {setting.value}: {value}")
+        elif setting in _TRIM_SETTINGS:
+            command, range_ = _TRIM_SETTINGS[setting]
+            validate_trim(value, range_)
+            arg = db_to_tenths(value)
+        elif setting is LyngdorfSetting.LIPSYNC:
+            if value < self.min_lipsync or value > self.max_lipsync:
+                raise ValueError(f"Invalid lipsync: {value}")
+            command, arg = LyngdorfCommand.LIPSYNC, int(value)
+        elif setting is LyngdorfSetting.MUTE:
+            command = LyngdorfCommand.MUTE_ON if value else LyngdorfCommand.MUTE_OFF
+        else:
+            self._validate_volume(value)
+            command, arg = LyngdorfCommand.VOLUME, db_to_tenths(value)
+
+        try:
+            definition = self._api.device_protocol.commands.get_command(command)
+        except ValueError:
+            raise ValueError(f"Unsupported setting: {setting.value}") from None
+        return definition.format(arg)
+
+    async def async_apply_settings(
+        self,
+        settings: Mapping[LyngdorfSetting | str, Any],
+        timeout: float | None = None,
+    ) -> dict[LyngdorfSetting, bool]:
+        """
+        Apply settings in one batch and return which the device confirmed.
+
+        Every value is validated before anything is sent. The commands go out
+        in a single write, in the order of LyngdorfSetting, and their
+        confirmations are awaited together. Notifications of the changes are
+        delivered as one batch at the end.
+        """
+        commands: dict[LyngdorfSetting, str] = {}
+        for key, value in settings.items():
+            setting = LyngdorfSetting(key)
+            commands[setting] = self._setting_command(setting, value)
+        ordered = [setting for setting in LyngdorfSetting if setting in commands]
+        if not ordered:
+            return {}
+        if LyngdorfSetting.VOLUME in commands:
+            self._volume_ramp.cancel()
+
+        async with self.transaction():
+            missing = await self._api.async_send_batch(
+                *(commands[setting] for setting in ordered),
+                confirmation_timeout=timeout,
+            )
+        return {setting: commands[setting] not in missing for setting in ordered}
+
+    def snapshot(self) -> DeviceSnapshot:
+        """Return the current settings of the device."""
+        return DeviceSnapshot(
+            source=self._source,
+            audio_mode=self._audio_mode,
+            voicing=self._voicing,
+            focus_position=self._focus_position,
+            lipsync=self._lipsync,
+            bass_trim=self._bass_trim,
+            treble_trim=self._treble_trim,
+            center_trim=self._center_trim,
+            heights_trim=self._heights_trim,
+            lfe_trim=self._lfe_trim,
+            surrounds_trim=self._surrounds_trim,
+            mute=self._muted,
+            volume=self._volume,
+        )
+
+    async def async_restore(
+        self, snapshot: DeviceSnapshot, timeout: float | None = None
+    ) -> dict[LyngdorfSetting, bool]:
+        """
+        Restore the settings of a snapshot and return which were confirmed.
+
+        Only the settings that differ from the current state are sent, as one
+        batch of async_apply_settings.
+        """
+        return await self.async_apply_settings(
+            snapshot.changes(self.snapshot()), timeout
+        )
@@ -1,15 +1,23 @@
 import asyncio
 import inspect
-import json
 import logging
+import operator
+import sys
+import time
 from collections.abc import Awaitable, Callable, Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, replace
 from enum import Enum, IntEnum, StrEnum, auto
 from typing import Any, Final, TypeAlias
 
 import aiohttp
 
+from .codec import DEFAULT_CODEC, JsonCodec
 from .const import (
+    PLAYER_BOOTSTRAP_TIMEOUT,
+    PLAYER_CONNECTIONS_PER_HOST,
+    PLAYER_KEEPALIVE_TIMEOUT,
+    PLAYER_REQUEST_TIMEOUT,
+    POSITION_DRIFT,
     RECONNECT_BACKOFF,
     RECONNECT_MAX_WAIT,
     RECONNECT_SCALE,
@@ -62,6 +70,20 @@ _SHUFFLE_MAP = {
 }
 
 
+def _parse_play_mode(value: Any) -> PlayMode:
+    try:
+        return PlayMode(value)
+    except (ValueError, TypeError):
+        return PlayMode.NORMAL
+
+
+def _get_typed_value(entry: dict[str, Any] | None) -> Any:
+    if not isinstance(entry, dict):
+        return None
+    key = entry.get("type")
+    return entry.get(key) if isinstance(key, str) else None
+
+
 @dataclass(slots=True)
 class MediaData:
     state: MediaState = MediaState.STOPPED
@@ -74,52 +96,80 @@ class MediaData:
     position: int = 0
     shuffle: bool = False
     repeat: RepeatMode = RepeatMode.OFF
+    # Monotonic time at which position was valid, None unless playing or paused
+    position_updated_at: float | None = None
+
+    def current_position(self, now: float | None = None) -> int:
+        """Return the position extrapolated from its anchor."""
+        if self.state != MediaState.PLAYING or self.position_updated_at is None:
+            return self.position
+        elapsed = (time.monotonic() if now is None else now) - self.position_updated_at
+        return min(self.position + int(elapsed), self.duration or sys.maxsize)
 
     @classmethod
     def from_events(cls, events: dict[str, Any]) -> MediaDataType:
-        def parse_play_mode(value: Any) -> PlayMode:
-            try:
-                return PlayMode(value)
-            except (ValueError, TypeError):
-                return PlayMode.NORMAL
-
-        def get_typed_value(entry: dict[str, Any] | None) -> Any:
-            if not isinstance(entry, dict):
-                return None
-            key = entry.get("type")
-            return entry.get(key) if isinstance(key, str) else None
-
-        player_data = events.get(MusicPlayer.PATH_PLAYER_DATA, {})
-        playtime_data = events.get(MusicPlayer.PATH_PLAYTIME_DATA)
-        playmode_data = events.get(MusicPlayer.PATH_PLAYMODE_DATA)
-
-        media_data = player_data.get("mediaRoles", {})
-        media_meta_data = media_data.get("mediaData", {}).get("metaData", {})
-        track_data = player_data.get("trackRoles", {})
-        track_meta_data = track_data.get("mediaData", {}).get("metaData", {})
-
-        state = _STATE_MAP.get(player_data.get("state"), MediaState.STOPPED)
-        duration = int((player_data.get("status", {}).get("duration") or 0) / 1000)
-        position = int(get_typed_value(playtime_data) / 1000) if playtime_data else 0
-        mode = parse_play_mode(get_typed_value(playmode_data))
-        shuffle = _SHUFFLE_MAP.get(mode, False)
-        repeat = _REPEAT_MAP.get(mode, RepeatMode.OFF)
-
-        return cls(
-            state=state,
-            title=track_data.get("title") or media_data.get("title"),
-            artist=track_meta_data.get("artist") or media_meta_data.get("artist"),
-            album=track_meta_data.get("album") or media_meta_data.get("album"),
-            album_artist=track_meta_data.get("albumArtist")
-            or media_meta_data.get("albumArtist"),
-            image_url=track_data.get("icon") or media_data.get("icon"),
-            duration=duration,
-            position=position,
-            shuffle=shuffle,
-            repeat=repeat,
-        )
+        fields: dict[str, Any] = {}
+        for path in (
+            MusicPlayer.PATH_PLAYER_DATA,
+            MusicPlayer.PATH_PLAYTIME_DATA,
+            MusicPlayer.PATH_PLAYMODE_DATA,
+        ):
+            fields.update(cls.fields_from_event(path, events.get(path)))
+        return cls(**fields)
+
+    @staticmethod
+    def fields_from_event(path: str, value: Any) -> dict[str, Any]:
+        """Derive the fields that depend on the value of a subscribed path."""
+        if path == MusicPlayer.PATH_PLAYER_DATA:
+            player_data = value or {}
+            media_data = player_data.get("mediaRoles", {})
+            media_meta_data = media_data.get("mediaData", {}).get("metaData", {})
+            track_data = player_data.get("trackRoles", {})
+            track_meta_data = track_data.get("mediaData", {}).get("metaData", {})
+            status = player_data.get("status", {})
+
+            return {
+                "state": _STATE_MAP.get(player_data.get("state"), MediaState.STOPPED),
+                "title": track_data.get("title") or media_data.get("title"),
+                "artist": track_meta_data.get("artist")
+                or media_meta_data.get("artist"),
+                "album": track_meta_data.get("album") or media_meta_data.get("album"),
+                "album_artist": track_meta_data.get("albumArtist")
+                or media_meta_data.get("albumArtist"),
+                "image_url": track_data.get("icon") or media_data.get("icon"),
+                "duration": int((status.get("duration") or 0) / 1000),
+            }
+
+        if path == MusicPlayer.PATH_PLAYTIME_DATA:
+            return {"position": int(_get_typed_value(value) / 1000) if value else 0}
+
+        if path == MusicPlayer.PATH_PLAYMODE_DATA:
+            mode = _parse_play_mode(_get_typed_value(value))
+            return {
+                "shuffle": _SHUFFLE_MAP.get(mode, False),
+                "repeat": _REPEAT_MAP.get(mode, RepeatMode.OFF),
+            }
+
+        return {}
 
 
+@dataclass(slots=True)
+class MediaStats:
+    """Counters of the MediaData derived from poll batches."""
+
+    derived: int = 0
+    unchanged: int = 0
+    dispatched: int = 0
+
+
+_media_without_position = operator.attrgetter(
+    *(
+        field.name
+        for field in fields(MediaData)
+        if field.name not in ("position", "position_updated_at")
+    )
+)
+
 CallbackType = Callable[[MediaData], None | Awaitable[None] | None] | None
 
 
@@ -140,50 +190,105 @@ class MusicPlayer:
         host: str,
         callback: CallbackType = None,
         poll_timeout: int = 30,
+        bootstrap_timeout: float = PLAYER_BOOTSTRAP_TIMEOUT,
+        position_drift: float = POSITION_DRIFT,
+        session: aiohttp.ClientSession | None = None,
+        codec: JsonCodec = DEFAULT_CODEC,
     ) -> None:
         self.base_url = f"http://{host}:8080"
         self.callback = callback
         self.poll_timeout = poll_timeout
+        self.bootstrap_timeout = bootstrap_timeout
+        self.position_drift = position_drift
+        self.codec = codec
 
         self._running = False
-        self._session: aiohttp.ClientSession | None = None
+        # A shared session is only used, its owner closes it
+        self._shared_session = session
+        self._session: aiohttp.ClientSession | None = session
         self._poll_task: asyncio.Task[None] | None = None
         self._queue_id: str | None = None
         self._poll_url: str | None = None
         self._subscribe_url: str | None = None
         self._events: dict[str, Any] = {}
+        self._bootstrap_duration: float | None = None
+        self._fetch_latency: dict[str, float] = {}
+        self._media_data: MediaData | None = None
+        self._derived_media_data: MediaData | None = None
+        self._media_stats = MediaStats()
         self._lock = asyncio.Lock()
 
     async def _ensure_session(self) -> None:
+        if self._shared_session is not None:
+            return
         if not self._session or self._session.closed:
             _LOG.debug("Creating new aiohttp session.")
-            self._session = aiohttp.ClientSession()
+            # Room for the long poll next to controls and the bootstrap fetches
+            connector = aiohttp.TCPConnector(
+                limit_per_host=PLAYER_CONNECTIONS_PER_HOST,
+                keepalive_timeout=PLAYER_KEEPALIVE_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
 
-    async def _fetch_json(self, url: str) -> Any:
+    async def _fetch_json(
+        self, url: str, timeout: float = PLAYER_REQUEST_TIMEOUT
+    ) -> Any:
         """GET request and return parsed JSON."""
         assert self._session is not None
-        async with self._session.get(url) as response:
+        async with self._session.get(
+            url, timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
             response.raise_for_status()
-            return await response.json()
-
-    async def _update_events(self, path: str | None, data: Any) -> None:
-        """Update internal events dictionary."""
-        if path is None:
-            self._events.update(
-                {j["path"]: j.get("itemValue") for j in data if "path" in j}
-            )
-        else:
-            self._events[path] = data[0]
-        _LOG.debug("Events updated: %s", self._events)
+            return self.codec.loads(await response.read())
+
+    async def _update_events(self, path: str | None, data: Any) -> set[str]:
+        """Update internal events dictionary and return the changed paths."""
+        events = self._events
+        items = (
+            ((j["path"], j.get("itemValue")) for j in data if "path" in j)
+            if path is None
+            else ((path, data[0]),)
+        )
 
-    async def _dispatch_media_data(self) -> None:
-        """Generate MediaData and call the callback, with logging."""
+        changed: set[str] = set()
+        for item_path, value in items:
+            if item_path not in events or events[item_path] != value:
+                events[item_path] = value
+                changed.add(item_path)
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("Events updated: %s", {p: events[p] for p in changed})
+        return changed
+
+    async def _dispatch_media_data(self, changed: set[str] | None = None) -> None:
+        """
+        Derive MediaData and call the callback when it differs from the last.
+
+        With the changed paths of a batch, only their fields are derived again.
+        """
+        stats = self._media_stats
         if not all(p in self._events for p in self.PATHS):
+            self._derived_media_data = None
             media_data = MediaData(state=MediaState.STOPPED)
         else:
-            media_data = MediaData.from_events(self._events)
-
-        _LOG.debug("Dispatching MediaData: %s", media_data)
+            if changed is None or self._derived_media_data is None:
+                media_data = MediaData.from_events(self._events)
+            else:
+                fields: dict[str, Any] = {}
+                for path in changed:
+                    fields.update(MediaData.fields_from_event(path, self._events[path]))
+                media_data = replace(self._derived_media_data, **fields)
+            self._derived_media_data = media_data
+            media_data = self._anchor_position(media_data)
+            stats.derived += 1
+
+        if media_data == self._media_data:
+            stats.unchanged += 1
+            return
+
+        self._media_data = media_data
+        stats.dispatched += 1
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("Dispatching MediaData: %s", media_data)
 
         if self.callback:
             try:
@@ -194,48 +299,103 @@ class MusicPlayer:
             except Exception:
                 _LOG.exception("Callback error for MediaData")
 
+    def _anchor_position(self, media_data: MediaData) -> MediaData:
+        """
+        Keep the last position anchor while the position runs as extrapolated.
+
+        The position is anchored again on a seek, a track or state change,
+        or a drift beyond position_drift seconds.
+        """
+        if media_data.state == MediaState.STOPPED:
+            return media_data
+
+        now = time.monotonic()
+        last = self._media_data
+        if (
+            last is not None
+            and last.position_updated_at is not None
+            and _media_without_position(media_data) == _media_without_position(last)
+            and abs(media_data.position - last.current_position(now))
+            <= self.position_drift
+        ):
+            return last
+        return replace(media_data, position_updated_at=now)
+
+    @property
+    def media_stats(self) -> MediaStats:
+        """Return the counters of derived, unchanged and dispatched batches."""
+        return self._media_stats
+
     async def _initialize_queue(self) -> None:
-        """Initialize queue, fetch initial data, and subscribe."""
+        """Fetch initial data while initializing the queue and subscribing."""
+        started = time.monotonic()
         await self._ensure_session()
 
-        init_url = (
-            f"{self.base_url}/api/event/modifyQueue?queueId=&subscribe[]=&unsubscribe[]"
-        )
-        raw_text = await self._fetch_json(init_url)
-        self._queue_id = raw_text[1:-1]  # strip {}
-        _LOG.debug("Initialized queueId: %s", self._queue_id)
-
-        self._poll_url = (
-            f"{self.base_url}/api/event/pollQueue"
-            f"?queueId={self._queue_id}&timeout={self.poll_timeout}"
-        )
-        subscribe_entries = [{"path": p, "type": "itemWithValue"} for p in self.PATHS]
-        self._subscribe_url = (
-            f"{self.base_url}/api/event/modifyQueue?"
-            f"queueId={self._queue_id}&subscribe={json.dumps(subscribe_entries)}&unsubscribe=[]"
-        )
-
-        # Fetch initial data
         async def fetch_path(path: str) -> tuple[str, Any | None]:
             data_url = f"{self.base_url}/api/getData?path={path}&roles=value"
+            fetch_started = time.monotonic()
             try:
-                return path, await self._fetch_json(data_url)
+                data = await self._fetch_json(data_url)
             except Exception:
                 _LOG.exception("Failed to fetch initial data for %s", path)
                 return path, None
+            self._fetch_latency[path] = time.monotonic() - fetch_started
+            return path, data
+
+        async def subscribe() -> None:
+            init_url = (
+                f"{self.base_url}/api/event/modifyQueue"
+                "?queueId=&subscribe[]=&unsubscribe[]"
+            )
+            raw_text = await self._fetch_json(init_url)
+            queue_id = raw_text[1:-1]  # strip {}
+            _LOG.debug("Initialized queueId: %s", queue_id)
+
+            subscribe_entries = [
+                {"path": p, "type": "itemWithValue"} for p in self.PATHS
+            ]
+            self._subscribe_url = (
+                f"{self.base_url}/api/event/modifyQueue?"
+                f"queueId={queue_id}&subscribe={self.codec.dumps(subscribe_entries)}&unsubscribe=[]"
+            )
+            await self._fetch_json(self._subscribe_url)
 
-        async with asyncio.TaskGroup() as tg:
-            for p in self.PATHS:
-                tg.create_task(fetch_path(p))
+            # Only poll a queue with an established subscription
+            self._queue_id = queue_id
+            self._poll_url = (
+                f"{self.base_url}/api/event/pollQueue"
+                f"?queueId={queue_id}&timeout={self.poll_timeout}"
+            )
+
+        # The initial data does not depend on the queue, fetch it meanwhile
+        async with asyncio.timeout(self.bootstrap_timeout):
+            subscription = asyncio.create_task(subscribe())
+            try:
+                results = await asyncio.gather(*(fetch_path(p) for p in self.PATHS))
+                for path, data in results:
+                    if data is not None:
+                        await self._update_events(path, data)
+                await self._dispatch_media_data()
+                await subscription
+            finally:
+                subscription.cancel()
+
+        self._bootstrap_duration = time.monotonic() - started
+        _LOG.debug(
+            "Subscription established for queueId=%s in %.3fs",
+            self._queue_id,
+            self._bootstrap_duration,
+        )
 
-        for p in self.PATHS:
-            data = await fetch_path(p)
-            if data[1] is not None:
-                await self._update_events(p, data[1])
+    @property
+    def bootstrap_duration(self) -> float | None:
+        """Return the seconds the last queue initialization took."""
+        return self._bootstrap_duration
 
-        await self._dispatch_media_data()
-        await self._fetch_json(self._subscribe_url)
-        _LOG.debug("Subscription established for queueId=%s", self._queue_id)
+    @property
+    def fetch_latency(self) -> Mapping[str, float]:
+        """Return the seconds of the last initial data fetch per path."""
+        return self._fetch_latency
 
     async def _poll_loop(self) -> None:
         """Continuously poll queue for events."""
@@ -249,9 +409,14 @@ class MusicPlayer:
                     assert self._poll_url is not None
                     _LOG.debug("self._poll_url: %s", self._poll_url)
 
-                    data = await self._fetch_json(self._poll_url)
-                    await self._update_events(None, data)
-                    await self._dispatch_media_data()
+                    data = await self._fetch_json(
+                        self._poll_url, self.poll_timeout + PLAYER_REQUEST_TIMEOUT
+                    )
+                    changed = await self._update_events(None, data)
+                    if changed:
+                        await self._dispatch_media_data(changed)
+                    else:
+                        self._media_stats.unchanged += 1
 
                 except (
                     TimeoutError,
@@ -271,17 +436,15 @@ class MusicPlayer:
             raise
 
     async def _reset_state(self) -> None:
-        """Reset internal poller state."""
-        if self._session and not self._session.closed:
-            await self._session.close()
-        self._session = None
+        """Reset internal poller state, keeping the session and its connections."""
         self._queue_id = None
         self._poll_url = None
         self._subscribe_url = None
         self._events.clear()
+        self._derived_media_data = None
 
     async def _reconnect(self, backoff: float) -> None:
-        """Close session and reset state before reconnecting."""
+        """Reset state before reconnecting."""
         _LOG.debug("Reconnecting after %.1f seconds.", backoff)
         await self._reset_state()
         await asyncio.sleep(backoff)
@@ -316,7 +479,7 @@ class MusicPlayer:
                     _LOG.debug("Poll task cancelled successfully.")
                 self._poll_task = None
 
-            if self._session:
+            if self._session and self._session is not self._shared_session:
                 await self._session.close()
                 self._session = None
 
@@ -327,7 +490,7 @@ class MusicPlayer:
 
     def _encode(self, value: str | Mapping[str, Any]) -> str:
         """Encode to JSON."""
-        return json.dumps(value) if not isinstance(value, str) else value
+        return self.codec.dumps(value) if not isinstance(value, str) else value
 
     async def _set_data(
         self,
@@ -346,7 +509,11 @@ class MusicPlayer:
         if self._session is None:
             raise RuntimeError("HTTP session not initialized")
 
-        async with self._session.get(url, params=params) as resp:
+        async with self._session.get(
+            url,
+            params=params,
+            timeout=aiohttp.ClientTimeout(total=PLAYER_REQUEST_TIMEOUT),
+        ) as resp:
             resp.raise_for_status()
             return resp.status
 
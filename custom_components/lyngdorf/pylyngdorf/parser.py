@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Module implements the message parser for Lyngdorf devices.
+
+:license: MIT, see LICENSE for more details.
+"""
+
+import logging
+import re
+from collections.abc import Callable
+from typing import Any, Final, NamedTuple
+
+from .const import COMMAND_PREFIX, ECHO_PREFIX
+from .utils import convert_on_off_bool
+
+_LOGGER = logging.getLogger(__name__)
+
+_PREFIXES: Final = (COMMAND_PREFIX, ECHO_PREFIX)
+
+_MESSAGE_PATTERN: Final = re.compile(
+    f"^[{COMMAND_PREFIX}{ECHO_PREFIX}]"  # Must start with '!' or '#'
+    r"(?P<cmd>\w+)"  # Command name
+    r"\??"  # Optional '?'
+    r"(?:\((?P<params>[^\)]*)\))?"  # Optional (param1,param2)
+    r"(?:\"(?P<string>[^\"]*)\")?"  # Optional "string"
+)
+
+_SPLIT_PARAMS: Final = re.compile(r'"(.*?)"|([^,]+)')
+
+Decoder = Callable[[list[str]], list[Any]]
+
+
+class LyngdorfParsedMessage(NamedTuple):
+    """Represents a parsed message from the Lyngdorf protocol."""
+
+    event: str
+    params: list[Any]
+
+
+def parse_message(message: str) -> LyngdorfParsedMessage | None:
+    """Parse a message string into an event name and list of parameters."""
+    match = _MESSAGE_PATTERN.match(message)
+    if not match:
+        _LOGGER.debug("Not matched %s", message)
+        return None
+
+    command = match.group("cmd")
+    params_raw = match.group("params")
+    trailing = match.group("string")
+
+    def _split_params(s: str) -> list[str]:
+        return [m[0] or m[1].strip() for m in re.findall(_SPLIT_PARAMS, s)]
+
+    params = _split_params(params_raw) if params_raw else []
+    if trailing is not None:
+        params.append(trailing)
+
+    return LyngdorfParsedMessage(command, params)
+
+
+def tokenize_message(message: str) -> LyngdorfParsedMessage | None:
+    """
+    Split a message into an event name and list of parameters in one pass.
+
+    Handles the `!EVENT?(a,b)"string"` form, where parameters may be quoted
+    as in `!SRC(1,"HDMI 1")`. Return None for malformed input, so the
+    caller can fall back to parse_message, which gives the same result for
+    every form.
+    """
+    if not message or message[0] not in _PREFIXES:
+        return None
+
+    head, paren, rest = message.partition("(")
+    event = head[1:-1] if head[-1] == "?" else head[1:]
+    if not event.isalnum():
+        return None
+    if not paren:
+        return LyngdorfParsedMessage(event, [])
+
+    inner, close, tail = rest.partition(")")
+    if not close:
+        return None
+    if '"' not in inner:
+        params: list[Any] = [param.strip() for param in inner.split(",") if param]
+    elif (params := _split_quoted(inner)) is None:
+        return None
+    if tail and tail[0] == '"' and (end := tail.find('"', 1)) != -1:
+        params.append(tail[1:end])
+    return LyngdorfParsedMessage(event, params)
+
+
+def _split_quoted(inner: str) -> list[Any] | None:
+    """
+    Split parameters with quoted ones, None unless quotes pair up by commas.
+
+    Quoted parameters are kept as is, the others are stripped.
+    """
+    segments = inner.split('"')
+    if len(segments) % 2 == 0:
+        return None
+    last = len(segments) - 1
+    params: list[Any] = []
+    for index, segment in enumerate(segments):
+        if index % 2:
+            params.append(segment)
+            continue
+        if segment and (
+            (index and segment[0] != ",") or (index < last and segment[-1] != ",")
+        ):
+            return None
+        params.extend(param.strip() for param in segment.split(",") if param)
+    return params
+
+
+def decode_bool(params: list[str]) -> list[Any]:
+    """Decode a 1/0 or ON/OFF parameter."""
+    return [convert_on_off_bool(params[0])] if params else []
+
+
+def decode_int(params: list[str]) -> list[Any]:
+    """Decode integer parameters."""
+    return [int(param) for param in params]
+
+
+def decode_tenths(params: list[str]) -> list[Any]:
+    """Decode a value in tenths of a dB into dB."""
+    return [float(params[0]) / 10.0] if params else []
+
+
+def decode_indexed(params: list[str]) -> list[Any]:
+    """Decode an item id followed by its optional name."""
+    return [int(params[0]), *params[1:]] if params else []
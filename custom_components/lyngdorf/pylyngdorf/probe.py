@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Module implements a lightweight model probe for Lyngdorf devices.
+
+:license: MIT, see LICENSE for more details.
+"""
+
+import asyncio
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+from .api import LyngdorfProtocol
+from .config import COMMON_QUERIES
+from .const import (
+    COMMAND_PREFIX,
+    DEFAULT_PORT,
+    PROBE_CONCURRENCY,
+    PROBE_TIMEOUT,
+    DeviceModel,
+    LyngdorfQuery,
+)
+from .exceptions import (
+    LyngdorfError,
+    LyngdorfNetworkError,
+    LyngdorfProcessingError,
+    LyngdorfTimoutError,
+)
+from .parser import parse_message
+from .registry import CONNECTIONS
+
+_LOGGER = logging.getLogger(__name__)
+
+_DEVICE_EVENT = "DEVICE"
+
+
+async def async_probe_model(
+    host: str, port: int = DEFAULT_PORT, timeout: float = PROBE_TIMEOUT
+) -> DeviceModel | None:
+    """
+    Return the model reported by a processor.
+
+    Only the device query is sent over a short-lived connection; no
+    verbose mode, state sync or monitoring is set up. A connection shared
+    through the registry is used instead when there is one. None is
+    returned when the processor reports a model that is not supported.
+    """
+    if (api := CONNECTIONS.get(host, port)) is not None and api.healthy:
+        model = await _async_query_shared(host, port, timeout)
+    else:
+        model = await _async_query_connection(host, port, timeout)
+
+    _LOGGER.debug("%s: Probed model %s", host, model)
+    if model is None or model not in DeviceModel._value2member_map_:
+        return None
+    return DeviceModel(model)
+
+
+async def _async_query_shared(host: str, port: int, timeout: float) -> str | None:
+    """Query the model over the shared connection to a processor."""
+    answer: asyncio.Future[str | None] = asyncio.get_running_loop().create_future()
+
+    async def _on_device(event: str, params: list[Any]) -> None:
+        if not answer.done():
+            answer.set_result(params[0] if params else None)
+
+    handle = CONNECTIONS.acquire(host, port)
+    handle.register_callback(_DEVICE_EVENT, _on_device)
+    try:
+        async with asyncio.timeout(timeout):
+            await handle.api.async_send_commands(COMMON_QUERIES[LyngdorfQuery.DEVICE])
+            return await answer
+    except TimeoutError as err:
+        _LOGGER.debug("%s: Timeout exception on probe", host)
+        raise LyngdorfTimoutError(f"TimeoutException: {err}", "probe") from err
+    except LyngdorfProcessingError as err:
+        raise LyngdorfNetworkError(str(err), "probe") from err
+    finally:
+        await handle.async_release()
+
+
+async def _async_query_connection(host: str, port: int, timeout: float) -> str | None:
+    """Query the model over a short-lived connection to a processor."""
+    loop = asyncio.get_running_loop()
+    answer: asyncio.Future[str | None] = loop.create_future()
+
+    def _on_message(message: str) -> None:
+        parsed = parse_message(message)
+        if parsed is None or parsed.event != _DEVICE_EVENT or answer.done():
+            return
+        if message.startswith(COMMAND_PREFIX):
+            answer.set_result(parsed.params[0] if parsed.params else None)
+
+    def _on_connection_lost() -> None:
+        if not answer.done():
+            answer.set_exception(
+                LyngdorfNetworkError("Connection closed by device", "probe")
+            )
+
+    protocol: LyngdorfProtocol | None = None
+    try:
+        async with asyncio.timeout(timeout):
+            _, protocol = await loop.create_connection(
+                lambda: LyngdorfProtocol(
+                    on_message=_on_message, on_connection_lost=_on_connection_lost
+                ),
+                host,
+                port,
+            )
+            protocol.write(f"{COMMAND_PREFIX}{COMMON_QUERIES[LyngdorfQuery.DEVICE]}\r")
+            model = await answer
+    except TimeoutError as err:
+        _LOGGER.debug("%s: Timeout exception on probe", host)
+        raise LyngdorfTimoutError(f"TimeoutException: {err}", "probe") from err
+    except OSError as err:
+        _LOGGER.debug("%s: Connection failed on probe: %s", host, err)
+        raise LyngdorfNetworkError(f"OSError: {err}", "probe") from err
+    finally:
+        answer.cancel()
+        if protocol is not None:
+            protocol.close()
+    return model
+
+
+async def async_probe_models(
+    hosts: Iterable[str],
+    port: int = DEFAULT_PORT,
+    timeout: float = PROBE_TIMEOUT,
+    limit: int = PROBE_CONCURRENCY,
+) -> dict[str, DeviceModel | LyngdorfError | None]:
+    """
+    Probe many processors concurrently.
+
+    At most `limit` connections are open at a time. The result maps each
+    host to its model, or to the error raised while probing it.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _probe(host: str) -> DeviceModel | LyngdorfError | None:
+        async with semaphore:
+            try:
+                return await async_probe_model(host, port, timeout)
+            except LyngdorfError as err:
+                return err
+
+    hosts = list(dict.fromkeys(hosts))
+    results = await asyncio.gather(*(_probe(host) for host in hosts))
+    return dict(zip(hosts, results, strict=True))
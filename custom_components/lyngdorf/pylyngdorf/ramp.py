@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Module implements the volume ramp of Lyngdorf devices.
+
+:license: MIT, see LICENSE for more details.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+import attr
+
+from .const import LYNGDORF_ATTR_SETATTR, RAMP_INTERVAL
+from .exceptions import LyngdorfError
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@attr.define(slots=True)
+class RampStats:
+    """Counters of the volume ramp."""
+
+    targets: int = 0
+    superseded: int = 0
+    writes: int = 0
+
+
+@attr.define(on_setattr=LYNGDORF_ATTR_SETATTR)
+class VolumeRamp:
+    """
+    Move the volume of a device towards the latest target.
+
+    A single command is in flight: the next one is written once the device
+    confirmed the previous one, so the write rate follows the confirmation
+    latency of the device. A new target replaces the pending one and the
+    values in between are never written. With a duration, every write sends
+    the point of the line from the start volume to the target at that time,
+    at most every interval seconds.
+    """
+
+    write: Callable[[float], Awaitable[None]] = attr.field()
+    current: Callable[[], float | None] = attr.field()
+    interval: float = attr.field(converter=float, default=RAMP_INTERVAL)
+    _target: float | None = attr.field(default=None, init=False)
+    _start: float | None = attr.field(default=None, init=False)
+    _started_at: float = attr.field(default=0.0, init=False)
+    _duration: float = attr.field(default=0.0, init=False)
+    _waiters: list[asyncio.Future[None]] = attr.field(factory=list, init=False)
+    _task: asyncio.Task[None] | None = attr.field(default=None, init=False)
+    _stats: RampStats = attr.field(factory=RampStats, init=False)
+
+    @property
+    def active(self) -> bool:
+        """Return True while a target is being approached."""
+        return self._target is not None
+
+    @property
+    def target(self) -> float | None:
+        """Return the volume being approached."""
+        return self._target
+
+    @property
+    def stats(self) -> RampStats:
+        """Return the counters of the ramp."""
+        return self._stats
+
+    async def async_move(self, volume: float, duration: float | None = None) -> None:
+        """
+        Approach volume in dB, over duration seconds if given.
+
+        Returns once the device confirmed the volume, or early when a newer
+        target supersedes it.
+        """
+        loop = asyncio.get_running_loop()
+        self._supersede()
+        self._stats.targets += 1
+        self._target = round(volume, 1)
+        self._start = self.current() if duration else None
+        self._started_at = loop.time()
+        self._duration = duration or 0.0
+
+        waiter = loop.create_future()
+        self._waiters.append(waiter)
+        if self._task is None:
+            self._task = loop.create_task(self._async_run())
+        await waiter
+
+    def cancel(self) -> None:
+        """Stop the ramp, releasing the callers waiting for it."""
+        self._supersede()
+        self._target = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _supersede(self) -> None:
+        """Release the callers waiting for the current target."""
+        if self._target is not None:
+            self._stats.superseded += 1
+        self._resolve()
+
+    def _resolve(self, err: Exception | None = None) -> None:
+        """Resolve the waiting callers, with an error if given."""
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if waiter.done():
+                continue
+            if err is None:
+                waiter.set_result(None)
+            else:
+                waiter.set_exception(err)
+
+    def _next_value(self, now: float, written: float | None) -> float | None:
+        """Return the volume to write now, None once the target is written."""
+        target = self._target
+        if target is None:
+            return None
+        value = target
+        if self._start is not None and now - self._started_at < self._duration:
+            progress = (now - self._started_at) / self._duration
+            value = round(self._start + (target - self._start) * progress, 1)
+        return None if value == target == written else value
+
+    async def _async_run(self) -> None:
+        """Write volumes until the latest target is confirmed."""
+        loop = asyncio.get_running_loop()
+        written: float | None = None
+        try:
+            while (value := self._next_value(loop.time(), written)) is not None:
+                written_at = loop.time()
+                if value != written:
+                    await self.write(value)
+                    written = value
+                    self._stats.writes += 1
+                if self._start is not None and value != self._target:
+                    await asyncio.sleep(written_at + self.interval - loop.time())
+        except (LyngdorfError, OSError, ValueError) as err:
+            _LOGGER.debug("Volume ramp to %s failed: %s", self._target, err)
+            self._target = None
+            self._resolve(err)
+        else:
+            self._target = None
+            self._resolve()
+        finally:
+            if self._task is asyncio.current_task():
+                self._task = None
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Module implements the shared connections to Lyngdorf devices.
+
+:license: MIT, see LICENSE for more details.
+"""
+
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any, Self
+
+import attr
+
+from .api import LyngdorfApi
+from .config import DEFAULT_PROTOCOL
+from .const import DEFAULT_PORT
+from .parser import Decoder
+
+_LOGGER = logging.getLogger(__name__)
+
+CallbackType = Callable[[str, list[Any]], Awaitable[None]]
+
+
+@attr.define(eq=False)
+class _SharedConnection:
+    """An API connection and the number of handles on it."""
+
+    key: tuple[str, int]
+    api: LyngdorfApi
+    handles: int = 0
+
+    def attach(self, api: LyngdorfApi) -> None:
+        """
+        Reconcile the settings of an API joining the connection.
+
+        A device protocol replaces the default one of the shared API, along
+        with the timeout and pipeline window of the joining API. Different
+        device protocols cannot share a connection.
+        """
+        protocol = api.device_protocol
+        if protocol is DEFAULT_PROTOCOL or protocol == self.api.device_protocol:
+            return
+        if self.api.device_protocol is not DEFAULT_PROTOCOL:
+            host, port = self.key
+            raise ValueError(
+                f"{host}:{port}: Connection is shared with another device protocol"
+            )
+        _LOGGER.debug("%s:%d: Upgrading the shared device protocol", *self.key)
+        self.api.device_protocol = protocol
+        self.api.timeout = api.timeout
+        self.api.pipeline_window = api.pipeline_window
+
+
+@attr.define(eq=False)
+class ConnectionHandle:
+    """
+    A reference to a shared connection.
+
+    The callbacks registered through the handle are removed on release, and
+    the connection is closed when its last handle is released.
+    """
+
+    _registry: "ConnectionRegistry" = attr.field()
+    _shared: _SharedConnection = attr.field()
+    _callbacks: list[tuple[str, CallbackType]] = attr.field(factory=list, init=False)
+    _released: bool = attr.field(default=False, init=False)
+
+    @property
+    def api(self) -> LyngdorfApi:
+        """Return the shared API."""
+        return self._shared.api
+
+    @property
+    def released(self) -> bool:
+        """Return True once the handle has been released."""
+        return self._released
+
+    def register_callback(
+        self, event: str, callback: CallbackType, decoder: Decoder | None = None
+    ) -> None:
+        """Register a callback on the shared API until the handle is released."""
+        self.api.register_callback(event, callback, decoder)
+        self._callbacks.append((event, callback))
+
+    async def async_connect(self) -> None:
+        """
+        Connect the shared API.
+
+        When another handle connected it already, the state is queried again
+        so that callbacks registered since receive it.
+        """
+        await self.api.async_connect(resync=True)
+
+    async def async_release(self) -> None:
+        """Release the handle, closing the connection if it was the last one."""
+        if self._released:
+            return
+        self._released = True
+        for event, callback in self._callbacks:
+            self.api.unregister_callback(event, callback)
+        self._callbacks.clear()
+        await self._registry._async_release(self._shared)
+
+    async def __aenter__(self) -> Self:
+        try:
+            await self.async_connect()
+        except BaseException:
+            await self.async_release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.async_release()
+
+
+@attr.define
+class ConnectionRegistry:
+    """
+    Hand out reference counted handles on one API connection per device.
+
+    Consumers of the same host and port share the socket: events reach the
+    callbacks of all of them and commands are serialised by the API. The
+    settings of the API that created the connection apply to all handles,
+    until an API with a device protocol joins one created with the default
+    protocol.
+    """
+
+    _connections: dict[tuple[str, int], _SharedConnection] = attr.field(
+        factory=dict, init=False
+    )
+
+    def acquire(
+        self, host: str, port: int = DEFAULT_PORT, api: LyngdorfApi | None = None
+    ) -> ConnectionHandle:
+        """
+        Return a handle on the connection to a device.
+
+        Without a shared connection, api becomes the shared one, or a new API
+        is created. Otherwise the settings of api are reconciled with the
+        shared one, see _SharedConnection.attach(). Connect it with
+        ConnectionHandle.async_connect().
+        """
+        key = (host, port)
+        shared = self._connections.get(key)
+        if shared is None:
+            if api is None:
+                api = LyngdorfApi(
+                    device_protocol=DEFAULT_PROTOCOL, host=host, port=port
+                )
+            shared = self._connections[key] = _SharedConnection(key, api)
+            _LOGGER.debug("%s:%d: New shared connection", host, port)
+        elif api is not None and api is not shared.api:
+            shared.attach(api)
+        shared.handles += 1
+        return ConnectionHandle(self, shared)
+
+    def get(self, host: str, port: int = DEFAULT_PORT) -> LyngdorfApi | None:
+        """Return the shared API of a device, if there is one."""
+        shared = self._connections.get((host, port))
+        return shared.api if shared is not None else None
+
+    def handles(self, host: str, port: int = DEFAULT_PORT) -> int:
+        """Return the number of handles on the connection to a device."""
+        shared = self._connections.get((host, port))
+        return shared.handles if shared is not None else 0
+
+    async def _async_release(self, shared: _SharedConnection) -> None:
+        """Drop a handle, disconnecting after the last one."""
+        shared.handles -= 1
+        if shared.handles:
+            return
+        if self._connections.get(shared.key) is shared:
+            del self._connections[shared.key]
+        _LOGGER.debug("%s:%d: Closing shared connection", *shared.key)
+        await shared.api.async_disconnect()
+
+
+CONNECTIONS = ConnectionRegistry()
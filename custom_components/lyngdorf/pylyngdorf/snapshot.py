@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Module implements snapshots of the settings of Lyngdorf devices.
+
+:license: MIT, see LICENSE for more details.
+"""
+
+from typing import Any
+
+import attr
+
+from .const import LyngdorfSetting
+
+
+@attr.define(frozen=True, slots=True)
+class DeviceSnapshot:
+    """
+    Settable fields of a device at one moment.
+
+    Fields are named after the values of LyngdorfSetting and are None when
+    the device did not report them.
+    """
+
+    source: str | None = None
+    audio_mode: str | None = None
+    voicing: str | None = None
+    focus_position: str | None = None
+    lipsync: int | None = None
+    bass_trim: float | None = None
+    treble_trim: float | None = None
+    center_trim: float | None = None
+    heights_trim: float | None = None
+    lfe_trim: float | None = None
+    surrounds_trim: float | None = None
+    mute: bool | None = None
+    volume: float | None = None
+
+    def settings(self) -> dict[LyngdorfSetting, Any]:
+        """Return the known settings of the snapshot."""
+        return {
+            setting: value
+            for setting in LyngdorfSetting
+            if (value := getattr(self, setting.value)) is not None
+        }
+
+    def changes(self, current: "DeviceSnapshot") -> dict[LyngdorfSetting, Any]:
+        """Return the known settings of the snapshot that differ from current."""
+        return {
+            setting: value
+            for setting, value in self.settings().items()
+            if getattr(current, setting.value) != value
+        }
@@ -4,7 +4,9 @@ Module implements the utilities to Lyngdorf devices.
 :license: MIT, see LICENSE for more details.
 """
 
+import bisect
 import math
+from array import array
 from collections.abc import Mapping
 from typing import Final
 
@@ -16,6 +18,7 @@ _MIN_VOLUME_LINEAR: Final = 0.02
 _MAX_VOLUME_LINEAR: Final = 1.0
 _LINEAR_REF = 0.57  # Reference linear value
 _FRACTION = 0.5  # Midpoint fraction for dB_ref
+_BRACKET_MARGIN = 1e-15  # Relative margin around the analytic thresholds
 
 
 def compute_alpha(
@@ -88,10 +91,113 @@ def db_to_linear_flattened(db: float, max_volume: float, alpha: float) -> float:
     return round(linear_value, 3)
 
 
+@attr.define(slots=True)
+class VolumeCurve:
+    """
+    Lookup tables for the volume curve of a max volume, built on first use.
+
+    The dB to linear direction is tabulated at the 0.1 dB resolution of the
+    processor. The linear to dB direction stores, for every 0.5 dB step the
+    curve can return, the smallest linear value that maps to it, and finds
+    the step of a value with a binary search. Both give the same results as
+    db_to_linear_flattened and linear_to_db_flattened.
+    """
+
+    max_volume: float = attr.field(converter=float)
+    alpha: float = attr.field(init=False)
+    _levels: array | None = attr.field(default=None, init=False, repr=False)
+    _thresholds: list[float] | None = attr.field(default=None, init=False, repr=False)
+    _steps: list[float] = attr.field(factory=list, init=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        """Compute the curve exponent."""
+        self.alpha = compute_alpha(self.max_volume)
+
+    def db_to_linear(self, db: float) -> float:
+        """Convert dB value to a float linear value [0-1]."""
+        if self._levels is None:
+            size = round((self.max_volume - MIN_VOLUME_DB) * 10) + 1
+            self._levels = array(
+                "d",
+                (
+                    db_to_linear_flattened(
+                        round(MIN_VOLUME_DB + i / 10, 1), self.max_volume, self.alpha
+                    )
+                    for i in range(size)
+                ),
+            )
+        db = round(max(min(db, self.max_volume), MIN_VOLUME_DB), 1)
+        return self._levels[round((db - MIN_VOLUME_DB) * 10)]
+
+    def linear_to_db(self, value: float) -> float:
+        """Convert a linear float [0-1] to dB (0.5 decimal)."""
+        if self._thresholds is None:
+            self._build_steps()
+        # Values below the range clamp to the first step, above to the last
+        index = bisect.bisect_right(self._thresholds, value)
+        return self._steps[index - 1 if index else 0]
+
+    def _build_steps(self) -> None:
+        """Find the linear value where each output of the curve starts."""
+        thresholds = [_MIN_VOLUME_LINEAR]
+        steps = [self._reference_db(_MIN_VOLUME_LINEAR)]
+        top = self._reference_db(_MAX_VOLUME_LINEAR)
+        while steps[-1] != top:
+            thresholds.append(self._next_threshold(thresholds[-1], steps[-1]))
+            steps.append(self._reference_db(thresholds[-1]))
+        self._thresholds, self._steps = thresholds, steps
+
+    def _reference_db(self, value: float) -> float:
+        """Return the dB value of the reference function."""
+        return linear_to_db_flattened(value, self.max_volume, self.alpha)
+
+    def _next_threshold(self, start: float, step: float) -> float:
+        """Return the smallest linear value above start that maps past step."""
+        # The rounding boundary of the step on the unrounded curve is close to
+        # the threshold. Bracket it with growing margins, then bisect.
+        guess = self._inverse(max(step, MIN_VOLUME_DB) + 0.25)
+        low = high = min(max(guess, start), _MAX_VOLUME_LINEAR)
+        margin = high * _BRACKET_MARGIN
+        while self._reference_db(low) != step:
+            low = max(low - margin, start)
+            margin *= 2
+        while self._reference_db(high) == step:
+            high = min(high + margin, _MAX_VOLUME_LINEAR)
+            margin *= 2
+        while (middle := (low + high) / 2) not in (low, high):
+            if self._reference_db(middle) == step:
+                low = middle
+            else:
+                high = middle
+        return high
+
+    def _inverse(self, db: float) -> float:
+        """Return the linear value of a dB value on the unrounded curve."""
+        t_flat = min(
+            max(db - MIN_VOLUME_DB, 0.0) / (self.max_volume - MIN_VOLUME_DB), 1.0
+        )
+        log_min = math.log10(_MIN_VOLUME_LINEAR)
+        log_max = math.log10(_MAX_VOLUME_LINEAR)
+        return 10 ** (log_min + t_flat ** (1 / self.alpha) * (log_max - log_min))
+
+
 @attr.define(auto_attribs=True)
 class FixedSizeDict:
+    """
+    Enumerated items of a fixed count, indexed both ways.
+
+    Ids may be enumerated in any order and repeated. The sorted view of the
+    values is cached until an item changes or the size is reset.
+    """
+
     max_size: int = 0
     _items: dict[int, str] = attr.ib(factory=dict[int, str], init=False)
+    _ids: dict[str, int] = attr.ib(
+        factory=dict[str, int], init=False, eq=False, repr=False
+    )
+    _view: tuple[str, ...] | None = attr.ib(
+        default=None, init=False, eq=False, repr=False
+    )
 
     def set_size(self, size: int) -> None:
         """Set a new size limit and clear existing items."""
@@ -99,29 +205,39 @@ class FixedSizeDict:
             raise ValueError("max_size must be >= 0")
         self.max_size = size
         self._items.clear()
+        self._ids.clear()
+        self._view = None
 
     def add(self, item_id: int, value: str) -> None:
-        """Add a new item if limit and uniqueness are respected."""
-        if self.is_full():
+        """Add an item, or replace the value of an id seen before."""
+        old_value = self._items.get(item_id)
+        if old_value is None and self.is_full():
             raise ValueError(f"Cannot add more than {self.max_size} items")
-        if item_id in self._items:
-            raise ValueError(f"Item with id '{item_id}' already exists")
-        self._items[item_id] = value
+        if old_value == value:
+            return
 
-    def get_all(self) -> list[str]:
-        """Return all items."""
-        return list(self._items.values())
+        self._items[item_id] = value
+        self._view = None
+        if old_value is not None and self._ids.get(old_value) == item_id:
+            del self._ids[old_value]
+            if old_ids := [k for k, v in self._items.items() if v == old_value]:
+                self._ids[old_value] = min(old_ids)
+        if self._ids.get(value, item_id) >= item_id:
+            self._ids[value] = item_id
+
+    def get_all(self) -> tuple[str, ...]:
+        """Return all values ordered by id."""
+        if self._view is None:
+            self._view = tuple(self._items[k] for k in sorted(self._items))
+        return self._view
 
     def get_by_id(self, item_id: int) -> str | None:
         """Lookup value by id."""
         return self._items.get(item_id)
 
     def get_by_value(self, value: str) -> int | None:
-        """Lookup id by value."""
-        for k, v in self._items.items():
-            if v == value:
-                return k
-        return None
+        """Lookup the lowest id of a value."""
+        return self._ids.get(value)
 
     def is_full(self) -> bool:
         """Check if max item count has been reached."""
@@ -147,6 +263,11 @@ def convert_volume(value: float | str) -> float | None:
         return None
 
 
+def db_to_tenths(value: float) -> int:
+    """Convert a dB value to the tenths of dB sent in commands."""
+    return round(value * 10)
+
+
 def lookup_description(key_str: str, lookup: Mapping[int, str | None]) -> str | None:
     """Convert the key to int and return value from the lookup dict, or None."""
     try:
@@ -11,7 +11,7 @@ from homeassistant.components.select import SelectEntity, SelectEntityDescriptio
 from .entity import LyngdorfCoordinator, LyngdorfEntity
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Sequence
 
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
@@ -27,7 +27,7 @@ class LyngdorfSelectDescription(SelectEntityDescription):
     """Class to describe an Lyngdorf select entity."""
 
     value_fn: Callable[[Lyngdorf], str | None]
-    options_fn: Callable[[Lyngdorf], list[str]]
+    options_fn: Callable[[Lyngdorf], Sequence[str]]
     set_value_fn: Callable[[Lyngdorf, str], Awaitable[None]]
 
 
@@ -89,7 +89,7 @@ class LyngdorfSelect(LyngdorfEntity, SelectEntity):
     @property
     def options(self) -> list[str]:
         """Return a set of selectable options."""
-        return self.entity_description.options_fn(self._receiver)
+        return list(self.entity_description.options_fn(self._receiver))
 
     @property
     def current_option(self) -> str | None: